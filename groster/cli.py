@@ -86,21 +86,25 @@ def cli(ctx: click.Context, debug: bool) -> None:
 @cli.command()
 @click.option(
     "--region",
-    default=lambda: os.getenv("WOW_REGION", "eu"),
+    envvar="WOW_REGION",
+    show_envvar=True,
+    default="eu",
     type=click.Choice(SUPPORTED_REGIONS),
     show_default=True,
     help="The region for the API request (e.g., 'eu').",
 )
 @click.option(
     "--realm",
-    default=lambda: os.getenv("WOW_REALM"),
-    required=os.getenv("WOW_REALM") is None,
+    envvar="WOW_REALM",
+    show_envvar=True,
+    required=True,
     help="The slug of the realm (e.g., 'terokkar').",
 )
 @click.option(
     "--guild",
-    default=lambda: os.getenv("WOW_GUILD"),
-    required=os.getenv("WOW_GUILD") is None,
+    envvar="WOW_GUILD",
+    show_envvar=True,
+    required=True,
     help="The slug of the guild (e.g., 'darq-side-of-the-moon').",
 )
 @click.option(
@@ -161,20 +165,23 @@ def serve(host: str, port: int) -> None:
 @cli.command()
 @click.option(
     "--app-id",
-    default=lambda: os.getenv("DISCORD_APP_ID"),
-    required=os.getenv("DISCORD_APP_ID") is None,
+    envvar="DISCORD_APP_ID",
+    show_envvar=True,
+    required=True,
     help="The ID of the Discord application.",
 )
 @click.option(
     "--guild-id",
-    default=lambda: os.getenv("DISCORD_GUILD_ID"),
-    required=os.getenv("DISCORD_GUILD_ID") is None,
+    envvar="DISCORD_GUILD_ID",
+    show_envvar=True,
+    required=True,
     help="The ID of the Discord guild.",
 )
 @click.option(
     "--bot-token",
-    default=lambda: os.getenv("DISCORD_BOT_TOKEN"),
-    required=os.getenv("DISCORD_BOT_TOKEN") is None,
+    envvar="DISCORD_BOT_TOKEN",
+    show_envvar=True,
+    required=True,
     help="The token of the Discord bot.",
 )
 def register(app_id: str, guild_id: str, bot_token: str) -> None:
@@ -6,15 +6,12 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from aiohttp import web
-from dotenv import load_dotenv
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
 from groster.constants import resolve_data_path
 from groster.repository import CsvRosterRepository, RosterRepository
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 VERIFY_KEY_APP_KEY = web.AppKey("verify_key", VerifyKey)
@@ -23,25 +20,81 @@ BOT_REGION_APP_KEY = web.AppKey("bot_region", str)
 BOT_REALM_APP_KEY = web.AppKey("bot_realm", str)
 BOT_GUILD_APP_KEY = web.AppKey("bot_guild", str)
 
+_CLASS_EMOJIS: dict[str, str] = {
+    "Death Knight": "💀",
+    "Demon Hunter": "😈",
+    "Druid": "🌿",
+    "Evoker": "🐉",
+    "Hunter": "🏹",
+    "Mage": "🧙",
+    "Monk": "🥋",
+    "Paladin": "⚔️",
+    "Priest": "🩸",
+    "Rogue": "🗡️",
+    "Shaman": "⚡",
+    "Warlock": "🔥",
+    "Warrior": "🛡️",
+}
+_DEFAULT_CLASS_EMOJI = "⚔️"
+
+_ROSTER_OUTDATED_AFTER = timedelta(days=1)
+
+_CHARACTER_BLOCK_TEMPLATE = (
+    "{emoji} **{name}** — {class}\n"
+    "Realm: {realm} ({region})\n"
+    "iLvl: {ilvl}\n"
+    "Last Login: {last_login}\n"
+)
+
+# Discord interaction payloads are small; anything larger is rejected unread
+MAX_INTERACTION_BODY_SIZE = 64 * 1024
+
+# Responses that never vary are serialized once at import time
+_PING_ACK_BODY = json.dumps({"type": 1}).encode()
+_PONG_BODY = json.dumps({"type": 4, "data": {"content": "pong"}}).encode()
+_NO_CHARACTER_NAME_BODY = json.dumps(
+    {"type": 4, "data": {"content": "Please provide a character name."}}
+).encode()
+_WHOIS_ERROR_BODY = json.dumps(
+    {
+        "type": 4,
+        "data": {
+            "content": "An error occurred while retrieving character information."
+        },
+    }
+).encode()
+_ALTS_UNAVAILABLE_BODY = json.dumps(
+    {
+        "type": 4,
+        "data": {
+            "content": (
+                "Guild roster data is not available yet. "
+                "Please ask the server administrator "
+                "to run a roster update."
+            ),
+            "flags": 64,
+        },
+    }
+).encode()
+_ALTS_ERROR_BODY = json.dumps(
+    {
+        "type": 4,
+        "data": {
+            "content": "An error occurred while retrieving the alt summary.",
+            "flags": 64,
+        },
+    }
+).encode()
+
+
+def _static_json_response(body: bytes) -> web.Response:
+    """Wrap a pre-serialized JSON payload in a response."""
+    return web.Response(body=body, content_type="application/json", charset="utf-8")
+
 
 def get_class_emoji(class_name: str) -> str:
     """Get emoji for class names."""
-    class_emojis = {
-        "Death Knight": "💀",
-        "Demon Hunter": "😈",
-        "Druid": "🌿",
-        "Evoker": "🐉",
-        "Hunter": "🏹",
-        "Mage": "🧙",
-        "Monk": "🥋",
-        "Paladin": "⚔️",
-        "Priest": "🩸",
-        "Rogue": "🗡️",
-        "Shaman": "⚡",
-        "Warlock": "🔥",
-        "Warrior": "🛡️",
-    }
-    return class_emojis.get(class_name, "⚔️")
+    return _CLASS_EMOJIS.get(class_name, _DEFAULT_CLASS_EMOJI)
 
 
 def _format_no_character_message(
@@ -57,7 +110,7 @@ def _format_no_character_message(
         modified_message = f" Last date of guild roster update was {formatted_date}."
 
         # Check if last date of roster update was more that 1 day ago
-        if modified_at < datetime.now() - timedelta(days=1):
+        if modified_at < datetime.now() - _ROSTER_OUTDATED_AFTER:
             modified_message += (
                 " The guild roster is outdated. Please contact the server "
                 "administrator to update the guild roster."
@@ -78,6 +131,17 @@ def _format_no_character_message(
     )
 
 
+def _format_character_block(character: dict[str, Any], region_tag: str) -> str:
+    """Render one character's lines of a /whois reply."""
+    return _CHARACTER_BLOCK_TEMPLATE.format_map(
+        {
+            **character,
+            "emoji": get_class_emoji(character["class"]),
+            "region": region_tag,
+        }
+    )
+
+
 def format_character_info(
     char_info: dict[str, Any] | None,
     character_name: str,
@@ -107,24 +171,16 @@ def format_character_info(
     region_tag = region.upper()
 
     # Format main character
-    main_emoji = get_class_emoji(char_info["class"])
-    response = "**Main:**\n"
-    response += f"{main_emoji} **{char_info['name']}** — {char_info['class']}\n"
-    response += f"Realm: {char_info['realm']} ({region_tag})\n"
-    response += f"iLvl: {char_info['ilvl']}\n"
-    response += f"Last Login: {char_info['last_login']}\n"
+    parts = ["**Main:**\n", _format_character_block(char_info, region_tag)]
 
     # Format alts if any
     if char_info.get("alts"):
-        response += "\n**Alts:**\n"
+        parts.append("\n**Alts:**\n")
         for alt in char_info["alts"]:
-            alt_emoji = get_class_emoji(alt["class"])
-            response += f"{alt_emoji} **{alt['name']}** — {alt['class']}\n"
-            response += f"Realm: {alt['realm']} ({region_tag})\n"
-            response += f"iLvl: {alt['ilvl']}\n"
-            response += f"Last Login: {alt['last_login']}\n\n"
+            parts.append(_format_character_block(alt, region_tag))
+            parts.append("\n")
 
-    return response.strip()
+    return "".join(parts).strip()
 
 
 def _utf8_len(s: str) -> int:
@@ -204,19 +260,7 @@ async def _handle_alts(
         alts_data = await repo.get_alts_per_main(region, realm, guild)
 
         if alts_data is None:
-            return web.json_response(
-                {
-                    "type": 4,
-                    "data": {
-                        "content": (
-                            "Guild roster data is not available yet. "
-                            "Please ask the server administrator "
-                            "to run a roster update."
-                        ),
-                        "flags": 64,
-                    },
-                }
-            )
+            return _static_json_response(_ALTS_UNAVAILABLE_BODY)
 
         embed = format_alts_embed(alts_data)
         return web.json_response(
@@ -230,15 +274,7 @@ async def _handle_alts(
         )
     except Exception:
         logger.exception("Error retrieving alt summary")
-        return web.json_response(
-            {
-                "type": 4,
-                "data": {
-                    "content": ("An error occurred while retrieving the alt summary."),
-                    "flags": 64,
-                },
-            }
-        )
+        return _static_json_response(_ALTS_ERROR_BODY)
 
 
 async def _handle_autocomplete(
@@ -300,12 +336,7 @@ async def _handle_whois(
 
     if not character_name:
         logger.warning("No character name provided")
-        return web.json_response(
-            {
-                "type": 4,
-                "data": {"content": "Please provide a character name."},
-            }
-        )
+        return _static_json_response(_NO_CHARACTER_NAME_BODY)
 
     try:
         char_info, modified_at = await repo.get_character_info_by_name(
@@ -351,34 +382,53 @@ async def _handle_whois(
         )
     except Exception:
         logger.exception("Error getting character info")
-        error_message = "An error occurred while retrieving character information."
-        return web.json_response(
-            {
-                "type": 4,
-                "data": {"content": error_message},
-            }
-        )
+        return _static_json_response(_WHOIS_ERROR_BODY)
 
 
-async def interactions_handler(request: web.Request) -> web.Response:
+async def _read_verified_body(request: web.Request) -> bytes | web.Response:
+    """Read the request body and verify its Discord Ed25519 signature.
+
+    Returns:
+        The raw body when the signature is valid, otherwise the error
+        response to send back.
+    """
     signature = request.headers.get("X-Signature-Ed25519")
     timestamp = request.headers.get("X-Signature-Timestamp")
 
     if not signature or not timestamp:
         return web.Response(text="Missing headers", status=401)
 
+    # An Ed25519 signature is 64 bytes, i.e. 128 hex characters
+    if len(signature) != 128:
+        logger.warning("Invalid request signature")
+        return web.Response(text="Invalid request signature", status=401)
+
+    content_length = request.content_length
+    if content_length is not None and content_length > MAX_INTERACTION_BODY_SIZE:
+        logger.warning("Rejecting oversized interaction body: %d bytes", content_length)
+        return web.Response(text="Request body too large", status=413)
+
     body = await request.read()
 
     try:
+        # Pass the signed message as one buffer: VerifyKey.verify() would
+        # otherwise prepend the signature to a second concatenated copy
         request.app[VERIFY_KEY_APP_KEY].verify(
-            timestamp.encode() + body,
-            bytes.fromhex(signature),
+            b"".join((bytes.fromhex(signature), timestamp.encode(), body))
         )
-    except BadSignatureError:
+    except (BadSignatureError, ValueError):
         logger.warning("Invalid request signature")
         return web.Response(text="Invalid request signature", status=401)
 
-    data = json.loads(body)
+    return body
+
+
+async def interactions_handler(request: web.Request) -> web.Response:
+    verified = await _read_verified_body(request)
+    if isinstance(verified, web.Response):
+        return verified
+
+    data = json.loads(verified)
 
     interaction_type = data.get("type")
     invoking_user = data.get("member", {}).get("user", {})
@@ -389,7 +439,7 @@ async def interactions_handler(request: web.Request) -> web.Response:
     # Discord PING
     if interaction_type == 1:
         logger.info("Received PING from Discord, responding with PONG.")
-        return web.json_response({"type": 1})
+        return _static_json_response(_PING_ACK_BODY)
 
     # Command
     if interaction_type == 2:
@@ -397,12 +447,7 @@ async def interactions_handler(request: web.Request) -> web.Response:
         logger.info("Received command: /%s", command_name)
 
         if command_name == "ping":
-            return web.json_response(
-                {
-                    "type": 4,
-                    "data": {"content": "pong"},
-                }
-            )
+            return _static_json_response(_PONG_BODY)
         if command_name == "whois":
             return await _handle_whois(
                 data,
@@ -449,7 +494,7 @@ def _create_app() -> web.Application:
 
     base_path = resolve_data_path()
 
-    app = web.Application()
+    app = web.Application(client_max_size=MAX_INTERACTION_BODY_SIZE)
     app[VERIFY_KEY_APP_KEY] = VerifyKey(bytes.fromhex(public_key))
     app[REPO_APP_KEY] = CsvRosterRepository(base_path=base_path)
     app[BOT_REGION_APP_KEY] = os.getenv("WOW_REGION", "eu")
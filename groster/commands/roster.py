@@ -1,9 +1,12 @@
+import asyncio
 import logging
 import os
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from groster.constants import resolve_data_path
+from groster.http_cache import FileResponseCache
 from groster.http_client import BlizzardAPIClient, BlizzardAPIError
 from groster.ranks import create_rank_mapping
 from groster.repository import CsvRosterRepository, RosterRepository
@@ -18,24 +21,65 @@ from groster.services import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on per-character files being written at the same time
+_SAVE_CONCURRENCY = 32
 
-async def summary_report(
-    repo: RosterRepository,
-    region: str,
-    realm: str,
-    guild: str,
-    time_diff: float,
-) -> None:
-    """Log a summary of the roster processing run."""
-    result = await repo.get_alt_summary(region, realm, guild)
 
+def summary_report(alts_data: list[dict[str, Any]], time_diff: float) -> None:
+    """Log a summary of the roster processing run.
+
+    Args:
+        alts_data: Alt detection results with 'alt' and 'main' per character.
+        time_diff: Duration of the run in seconds.
+    """
     logger.info("Processing completed in %.2f seconds", time_diff)
-    if result is not None:
-        total_alts, total_mains = result
+    if alts_data:
+        total_alts = sum(1 for row in alts_data if row["alt"])
+        total_mains = len({row["main"] for row in alts_data})
         logger.info("Alts found: %s", total_alts)
         logger.info("Main characters: %s", total_mains)
 
 
+async def _save_character_files(
+    save: Callable[[dict[str, Any], str, str, str], Awaitable[None]],
+    files: dict[str, dict[str, Any]],
+    region: str,
+    realm: str,
+) -> None:
+    """Save per-character raw data files concurrently.
+
+    Args:
+        save: Repository method that saves one character's data.
+        files: Mapping of character name to the data to save.
+        region: The region identifier (e.g., 'eu', 'us').
+        realm: The realm slug.
+    """
+    semaphore = asyncio.Semaphore(_SAVE_CONCURRENCY)
+
+    async def save_one(name: str, data: dict[str, Any]) -> None:
+        async with semaphore:
+            await save(data, region, realm, name)
+
+    await asyncio.gather(*(save_one(name, data) for name, data in files.items()))
+
+
+async def _run_concurrently(*aws: Awaitable[Any]) -> None:
+    """Run awaitables concurrently, cancelling the others if one fails.
+
+    Unlike a bare ``asyncio.gather``, no sibling is left running in the
+    background once the first exception propagates, and their outcomes are
+    retrieved before it is re-raised.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def _get_guild_ranks(
     repo: RosterRepository, region: str, realm: str, guild: str
 ) -> dict[int, str]:
@@ -127,8 +171,9 @@ async def _get_roster_details(
 
     if raw_profiles:
         logger.info("Saving raw profile data for %d characters", len(raw_profiles))
-        for name, profile_json in raw_profiles.items():
-            await repo.save_character_profile(profile_json, region, realm, name)
+        await _save_character_files(
+            repo.save_character_profile, raw_profiles, region, realm
+        )
 
     return roster_data, cached_profile_records
 
@@ -152,19 +197,24 @@ async def update_roster(
             "Missing BLIZZARD_CLIENT_ID/BLIZZARD_CLIENT_SECRET in environment"
         )
 
+    response_cache = FileResponseCache(base_path / "http-cache")
     client = BlizzardAPIClient(
         region=region,
         client_id=client_id,
         client_secret=client_secret,
         locale=locale,
+        response_cache=response_cache,
     )
 
     repo = CsvRosterRepository(base_path=base_path)
 
     try:
-        await _get_guild_ranks(repo, region, realm, guild)
-        await _get_playable_classes(repo, client)
-        await _get_playable_races(repo, client)
+        # Independent lookups: on a first run the API calls overlap
+        await _run_concurrently(
+            _get_guild_ranks(repo, region, realm, guild),
+            _get_playable_classes(repo, client),
+            _get_playable_races(repo, client),
+        )
 
         roster_data, cached_profile_records = await _get_roster_details(
             repo, client, region, realm, guild, force=force
@@ -230,22 +280,28 @@ async def update_roster(
 
         if new_fp_cache:
             logger.info("Caching fingerprint data for %d characters", len(new_fp_cache))
-            for name, fp_data in new_fp_cache.items():
-                await repo.save_character_achievements(fp_data, region, realm, name)
+            await _save_character_files(
+                repo.save_character_achievements, new_fp_cache, region, realm
+            )
 
         logger.info("Saving raw pets data for %d characters", len(all_raw_pets))
-        for name, pets_json in all_raw_pets.items():
-            await repo.save_character_pets(pets_json, region, realm, name)
+        await _save_character_files(
+            repo.save_character_pets, all_raw_pets, region, realm
+        )
 
         logger.info("Saving raw mounts data for %d characters", len(all_raw_mounts))
-        for name, mounts_json in all_raw_mounts.items():
-            await repo.save_character_mounts(mounts_json, region, realm, name)
+        await _save_character_files(
+            repo.save_character_mounts, all_raw_mounts, region, realm
+        )
 
         await repo.build_dashboard(region, realm, guild)
 
         end_time = time.time()
         time_diff = end_time - start_time
 
-        await summary_report(repo, region, realm, guild, time_diff)
+        summary_report(alts_data, time_diff)
     finally:
         await client.close()
+        removed = await response_cache.prune()
+        if removed:
+            logger.info("Pruned %d stale HTTP cache entries", removed)
@@ -101,22 +101,24 @@ ALT_SIMILARITY_THRESHOLD = 0.8
 TZ = "Europe/Paris"
 
 # Set of common, account-wide achievements IDs used to identify characters.
-FINGERPRINT_ACHIEVEMENT_IDS = {
-    9670,  # Toying Around
-    10693,  # Fashionista: Hand
-    10691,  # Fashionista: Shirt
-    10689,  # Fashionista: Weapon & Off-Hand
-    10687,  # Fashionista: Back
-    10685,  # Fashionista: Feet
-    10682,  # Fashionista: Chest
-    10692,  # Fashionista: Shoulder
-    10690,  # Fashionista: Tabard
-    10688,  # Fashionista: Wrist
-    10686,  # Fashionista: Waist
-    10684,  # Fashionista: Legs
-    10681,  # Fashionista: Head
-    11176,  # Fabulous
-}
+FINGERPRINT_ACHIEVEMENT_IDS = frozenset(
+    {
+        9670,  # Toying Around
+        10693,  # Fashionista: Hand
+        10691,  # Fashionista: Shirt
+        10689,  # Fashionista: Weapon & Off-Hand
+        10687,  # Fashionista: Back
+        10685,  # Fashionista: Feet
+        10682,  # Fashionista: Chest
+        10692,  # Fashionista: Shoulder
+        10690,  # Fashionista: Tabard
+        10688,  # Fashionista: Wrist
+        10686,  # Fashionista: Waist
+        10684,  # Fashionista: Legs
+        10681,  # Fashionista: Head
+        11176,  # Fabulous
+    }
+)
 
 # Weights for multi-factor main character scoring.
 # Each factor is normalized to 0.0–1.0 within the group, then multiplied
@@ -129,7 +131,7 @@ MAIN_SCORE_WEIGHTS: dict[str, int] = {
 }
 
 # Supported regions based on official Blizzard API documentation.
-SUPPORTED_REGIONS = {"us", "eu", "kr", "tw", "cn"}
+SUPPORTED_REGIONS = frozenset({"us", "eu", "kr", "tw", "cn"})
 
 
 # Default user agent for the Blizzard API.
@@ -0,0 +1,165 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    """Validators and decoded body of a previous GET response."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: dict[str, Any]
+
+
+class ResponseCache(ABC):
+    """Abstract store for conditional GET validators and payloads.
+
+    Entries are keyed by the full request URL, including query parameters.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a request key, or None if absent."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store the response for a request key, replacing any previous entry."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """Response cache that lives for the lifetime of the process.
+
+    Holds at most ``max_entries`` responses and evicts the least recently
+    used one when full, so long-lived clients do not grow without bound.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a request key, or None if absent."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store the response for a request key, replacing any previous entry."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileResponseCache(ResponseCache):
+    """Response cache persisted as one JSON file per request under a directory.
+
+    File names are derived from a hash of the request key, so entries survive
+    across runs and let unchanged resources be revalidated with a 304. Reading
+    an entry refreshes its modification time, and ``prune()`` drops entries
+    unused for ``max_age`` seconds and the least recently used ones beyond
+    ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_entries: int = 10_000,
+        max_age: float = 30 * 24 * 60 * 60,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a request key, or None if absent."""
+        return await asyncio.to_thread(self._read, self._entry_path(key))
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        """Store the response for a request key, replacing any previous entry."""
+        await asyncio.to_thread(self._write, self._entry_path(key), entry)
+
+    async def prune(self) -> int:
+        """Delete stale and least recently used entries beyond the size cap.
+
+        Returns:
+            The number of entries deleted.
+        """
+        return await asyncio.to_thread(self._prune)
+
+    def _prune(self) -> int:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        # Newest first, so everything past the cap is the least recently used
+        entries.sort(reverse=True)
+        cutoff = time.time() - self.max_age
+        removed = 0
+        for index, (mtime, path) in enumerate(entries):
+            if index < self.max_entries and mtime >= cutoff:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+                removed += 1
+            except OSError as exc:
+                logger.warning(
+                    "Failed to remove response cache entry %s: %s", path, exc
+                )
+        return removed
+
+    @staticmethod
+    def _read(path: Path) -> CachedResponse | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CachedResponse(
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                payload=data["payload"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable response cache entry %s: %s", path, exc)
+            return None
+
+        # Mark the entry as recently used for prune()
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    @staticmethod
+    def _write(path: Path, entry: CachedResponse) -> None:
+        # Write to a temporary file first so readers never see a partial entry
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as f:
+                f.write(json.dumps(entry._asdict(), ensure_ascii=False))
+            os.replace(f.name, path)
+        except OSError as exc:
+            logger.warning("Failed to write response cache entry %s: %s", path, exc)
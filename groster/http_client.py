@@ -1,11 +1,16 @@
 import asyncio
 import logging
+import random
 import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any, cast
+from urllib.parse import urlencode
 
 import httpx
 
 from groster.constants import DEFAULT_USER_AGENT, SUPPORTED_REGIONS
+from groster.http_cache import CachedResponse, ResponseCache
 from groster.models import PlayableClass, PlayableRace
 
 logger = logging.getLogger(__name__)
@@ -25,16 +30,83 @@ _API_HOSTS = {
     "*": "https://{region}.api.blizzard.com",
 }
 
+# How long static game data (classes, races) is reused before refetching.
+# It only changes with game patches.
+_STATIC_DATA_TTL = 24 * 60 * 60
+
+# Region list quoted in the error for an unsupported region
+_SUPPORTED_REGIONS_TEXT = ", ".join(sorted(SUPPORTED_REGIONS))
+
+# Upper bound on the exponential backoff between retries, in seconds
+_MAX_BACKOFF = 5
+
+# Random spread added on top of a server-provided Retry-After, in seconds
+_RETRY_AFTER_JITTER = 0.5
+
+# Longest Retry-After the client is willing to wait, in seconds
+_MAX_RETRY_AFTER = 60
+
+# Statuses worth retrying: rate limiting and temporary server failures
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Consecutive requests that must exhaust their retries before the client
+# stops calling the API, and how long it then waits before probing again
+_CIRCUIT_FAILURE_THRESHOLD = 10
+_CIRCUIT_OPEN_SECONDS = 30
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Return a full-jitter exponential backoff delay for a retry attempt.
+
+    Requests that fail together wait for different times, so they do not all
+    retry at the same moment and trip the rate limit again.
+    """
+    return random.uniform(0, min(0.5 * 2 ** (attempt - 1), _MAX_BACKOFF))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delay-seconds or an HTTP-date.
+
+    Returns:
+        The delay in seconds, clamped to [0, 60], or None if the header is
+        missing or malformed.
+    """
+    if not value:
+        return None
+
+    try:
+        delay = float(int(value))
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        delay = (retry_at - datetime.now(UTC)).total_seconds()
+
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
+
 
 def _validate_region(region: str) -> None:
     """Validate that the region is supported by the Blizzard API."""
     if region not in SUPPORTED_REGIONS:
         raise ValueError(
             f"Unsupported region '{region}'. "
-            f"Supported regions are: {', '.join(sorted(SUPPORTED_REGIONS))}"
+            f"Supported regions are: {_SUPPORTED_REGIONS_TEXT}"
         )
 
 
+def _conditional_headers(cached: CachedResponse) -> dict[str, str]:
+    """Build the revalidation headers for a cached response."""
+    headers = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
 class BlizzardAPIError(Exception):
     """Raised when a Blizzard API request fails after retries."""
 
@@ -43,6 +115,54 @@ class BlizzardAPIError(Exception):
         super().__init__(message)
 
 
+class _CircuitBreaker:
+    """Fail fast while the API keeps failing instead of retrying every call.
+
+    After ``threshold`` consecutive requests exhaust their retries, requests
+    are refused for ``open_seconds``. Then a single probe is let through:
+    if it succeeds the circuit closes, otherwise it stays open for another
+    period.
+    """
+
+    def __init__(self, threshold: int, open_seconds: float) -> None:
+        self.threshold = threshold
+        self.open_seconds = open_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now."""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.open_seconds:
+            return False
+        # Let this request probe the API; everyone else waits another period
+        self._opened_at = now
+        logger.warning("Probing Blizzard API after %ds", self.open_seconds)
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the API."""
+        if self._opened_at is not None:
+            logger.warning("Blizzard API is responding again, resuming requests")
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a request that exhausted its retries."""
+        self._failures += 1
+        if self._failures < self.threshold:
+            return
+        if self._opened_at is None:
+            logger.warning(
+                "Blizzard API failed %d requests in a row; skipping requests for %ds",
+                self._failures,
+                self.open_seconds,
+            )
+        self._opened_at = time.monotonic()
+
+
 class BlizzardAPIClient:
     """An HTTP client for the Blizzard Battle.net API."""
 
@@ -54,6 +174,7 @@ class BlizzardAPIClient:
         locale: str = "en_US",
         timeout: int = 10,
         max_retries: int = 5,
+        response_cache: ResponseCache | None = None,
     ):
         if not all([region, client_id, client_secret]):
             raise ValueError("Region, client ID, and client secret must be provided")
@@ -66,19 +187,48 @@ class BlizzardAPIClient:
 
         self._api_token: str | None = None
         self._token_expires_at: float = 0
+        self._token_lock = asyncio.Lock()
 
-        self._profile_params = {
-            "namespace": f"profile-{self.region}",
-            "locale": self.locale,
-        }
+        # Validators and decoded payloads of earlier GET responses, so repeated
+        # requests can be revalidated with If-None-Match / If-Modified-Since.
+        # Opt-in: a one-shot run never repeats a request within the process,
+        # so holding every decoded payload in memory would buy nothing.
+        self._response_cache = response_cache
 
-        self._static_params = {
-            "namespace": f"static-{self.region}",
-            "locale": self.locale,
-        }
+        # Use region-specific API host or fallback to standard pattern
+        if self.region in _API_HOSTS:
+            self._base_url = _API_HOSTS[self.region]
+        else:
+            self._base_url = _API_HOSTS["*"].format(region=self.region)
+        self._character_base_url = f"{self._base_url}/profile/wow/character"
+
+        # Query strings are encoded once here and appended to request URLs,
+        # instead of httpx re-encoding the same params dict on every request
+        self._profile_query = urlencode(
+            {"namespace": f"profile-{self.region}", "locale": self.locale}
+        )
+        self._static_query = urlencode(
+            {"namespace": f"static-{self.region}", "locale": self.locale}
+        )
+        # Static data index payloads by data key, with their monotonic expiry
+        self._static_data: dict[str, tuple[float, dict]] = {}
 
         self.max_retries = max_retries
-        transport = httpx.AsyncHTTPTransport(retries=max_retries)
+        self._circuit = _CircuitBreaker(
+            _CIRCUIT_FAILURE_THRESHOLD, _CIRCUIT_OPEN_SECONDS
+        )
+
+        # Keep as many idle connections as the callers run concurrent requests
+        # (50), otherwise httpx's default of 20 closes the rest after each
+        # response and every burst pays for new TCP and TLS handshakes. Idle
+        # connections also outlive httpx's 5 second default expiry, so they
+        # survive the pause between the profile and alt detection phases.
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        )
+        transport = httpx.AsyncHTTPTransport(retries=max_retries, limits=limits)
 
         lang_header = self.locale.replace("_", "-")
         self.client = httpx.AsyncClient(
@@ -93,21 +243,31 @@ class BlizzardAPIClient:
 
     def _format_url(self, path: str) -> str:
         """Format the URL for the Blizzard Battle.net API."""
-        path = path.lstrip("/")
-
-        # Use region-specific API host or fallback to standard pattern
-        if self.region in _API_HOSTS:
-            base_url = _API_HOSTS[self.region]
-        else:
-            base_url = _API_HOSTS["*"].format(region=self.region)
-
-        return f"{base_url}/{path}"
+        return f"{self._base_url}/{path.lstrip('/')}"
+
+    def _character_url(
+        self, realm_slug: str, char_name: str, resource: str = ""
+    ) -> str:
+        """Format a character profile URL, optionally for a sub-resource."""
+        return (
+            f"{self._character_base_url}/{realm_slug}/{char_name.lower()}{resource}"
+            f"?{self._profile_query}"
+        )
 
     async def _get_access_token(self) -> str:
         """Fetch or renews the OAuth access token."""
         if self._api_token and time.time() < self._token_expires_at:
             return self._api_token
 
+        # Concurrent requests that all find the token expired wait here for a
+        # single renewal instead of each posting to the token endpoint
+        async with self._token_lock:
+            if self._api_token and time.time() < self._token_expires_at:
+                return self._api_token
+            return await self._fetch_access_token()
+
+    async def _fetch_access_token(self) -> str:
+        """Request a new OAuth access token and install it on the client."""
         # Use region-specific OAuth host
         oauth_host = _OAUTH_HOSTS.get(self.region, _OAUTH_HOSTS["us"])
         url = f"{oauth_host}/token"
@@ -130,6 +290,7 @@ class BlizzardAPIClient:
                 raise ValueError("'access_token' not found in the response")
 
             self._api_token = str(access_token)
+            self.client.headers["Authorization"] = f"Bearer {self._api_token}"
             expires_in = token_data.get("expires_in", 3600)
             self._token_expires_at = time.time() + int(expires_in) - 60
 
@@ -139,16 +300,76 @@ class BlizzardAPIClient:
             logger.exception("Failed to obtain access token")
             raise
 
+    async def _decode_response(
+        self,
+        response: httpx.Response,
+        cache_key: str | None,
+        cached: CachedResponse | None,
+    ) -> dict[str, Any]:
+        """Decode a final response, serving 304s from and filling the cache.
+
+        Raises:
+            httpx.HTTPStatusError: When the response is an HTTP error.
+        """
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Not modified, reusing cached response: %s", cache_key)
+            return cached.payload
+
+        response.raise_for_status()
+        payload: dict[str, Any] = response.json()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (
+            self._response_cache is not None
+            and cache_key is not None
+            and (etag or last_modified)
+        ):
+            await self._response_cache.set(
+                cache_key, CachedResponse(etag, last_modified, payload)
+            )
+        return payload
+
     async def _request(self, method: str, url: str, **kwargs: Any) -> dict[str, Any]:
         """Make a HTTP request to the Blizzard API.
 
         Raises:
-            BlizzardAPIError: When the request fails after all retries or
-                encounters a non-retryable HTTP error.
+            BlizzardAPIError: When the request fails after all retries,
+                encounters a non-retryable HTTP error, or is skipped because
+                recent requests kept failing.
         """
-        token = await self._get_access_token()
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {token}"
+        if not self._circuit.allow():
+            raise BlizzardAPIError(
+                503, f"Skipped request to {url}: Blizzard API is unavailable"
+            )
+
+        try:
+            payload = await self._request_with_retries(method, url, **kwargs)
+        except BlizzardAPIError as exc:
+            if exc.status_code == 0 or exc.status_code in _RETRYABLE_STATUSES:
+                self._circuit.record_failure()
+            else:
+                self._circuit.record_success()
+            raise
+        self._circuit.record_success()
+        return payload
+
+    async def _request_with_retries(
+        self, method: str, url: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send a request, retrying rate limits and transient failures."""
+        # The bearer token lives in the client's default headers, so a request
+        # only carries its own headers when it has per-request ones to send
+        await self._get_access_token()
+        headers = kwargs.pop("headers", None)
+
+        cache_key = None
+        cached = None
+        if method == "GET" and self._response_cache is not None:
+            cache_key = str(httpx.URL(url, params=kwargs.get("params")))
+            cached = await self._response_cache.get(cache_key)
+            if cached is not None:
+                headers = {**(headers or {}), **_conditional_headers(cached)}
 
         last_status = 0
         last_message = ""
@@ -158,14 +379,16 @@ class BlizzardAPIClient:
                 response = await self.client.request(
                     method, url, headers=headers, **kwargs
                 )
-                if response.status_code in (429, 500, 502, 503, 504):
+                if response.status_code in _RETRYABLE_STATUSES:
                     last_status = response.status_code
                     last_message = f"HTTP {response.status_code}"
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after and retry_after.isdigit():
-                        delay = int(retry_after)
+                    retry_after = _parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    if retry_after is not None:
+                        delay = retry_after + random.uniform(0, _RETRY_AFTER_JITTER)
                     else:
-                        delay = min(0.5 * 2 ** (attempt - 1), 5)
+                        delay = _backoff_delay(attempt)
 
                     logger.warning(
                         "Transient %d from %s (attempt %d/%d); retrying in %.1fs",
@@ -178,8 +401,7 @@ class BlizzardAPIClient:
 
                     await asyncio.sleep(delay)
                     continue
-                response.raise_for_status()
-                return response.json()  # type: ignore[no-any-return]
+                return await self._decode_response(response, cache_key, cached)
             except httpx.RequestError as e:
                 req_url = e.request.url if getattr(e, "request", None) else url
                 last_status = 0
@@ -191,7 +413,7 @@ class BlizzardAPIClient:
                     self.max_retries,
                     e,
                 )
-                await asyncio.sleep(min(0.5 * 2 ** (attempt - 1), 5))
+                await asyncio.sleep(_backoff_delay(attempt))
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 404:
                     logger.info(
@@ -217,9 +439,15 @@ class BlizzardAPIClient:
         )
 
     async def _get_static_data(self, data_key: str) -> dict:
+        cached = self._static_data.get(data_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         path = f"data/wow/{data_key}/index"
-        url = self._format_url(path)
-        return await self._request("GET", url, params=self._static_params)
+        url = f"{self._format_url(path)}?{self._static_query}"
+        data = await self._request("GET", url)
+        self._static_data[data_key] = (time.monotonic() + _STATIC_DATA_TTL, data)
+        return data
 
     async def get_guild_roster(self, realm_slug: str, guild_slug: str) -> dict:
         """Fetch the roster of a guild.
@@ -235,9 +463,10 @@ class BlizzardAPIClient:
             BlizzardAPIError: When the request fails.
         """
         logger.debug("Fetching guild roster")
-        url = self._format_url(f"data/wow/guild/{realm_slug}/{guild_slug}/roster")
+        path = f"data/wow/guild/{realm_slug}/{guild_slug}/roster"
+        url = f"{self._format_url(path)}?{self._profile_query}"
 
-        return await self._request("GET", url, params=self._profile_params)
+        return await self._request("GET", url)
 
     async def get_character_profile(self, realm_slug: str, char_name: str) -> dict:
         """Fetch a character's profile.
@@ -254,10 +483,9 @@ class BlizzardAPIClient:
         """
         logger.debug("Fetching character profile for %s on %s", char_name, realm_slug)
 
-        name = char_name.lower()
-        url = self._format_url(f"profile/wow/character/{realm_slug}/{name}")
+        url = self._character_url(realm_slug, char_name)
 
-        return await self._request("GET", url, params=self._profile_params)
+        return await self._request("GET", url)
 
     async def get_character_achievements(self, realm_slug: str, char_name: str) -> dict:
         """Fetch a character's achievements.
@@ -276,12 +504,9 @@ class BlizzardAPIClient:
             "Fetching character achievements for %s on %s", char_name, realm_slug
         )
 
-        name = char_name.lower()
-        url = self._format_url(
-            f"profile/wow/character/{realm_slug}/{name}/achievements"
-        )
+        url = self._character_url(realm_slug, char_name, "/achievements")
 
-        return await self._request("GET", url, params=self._profile_params)
+        return await self._request("GET", url)
 
     async def get_character_pets(self, realm_slug: str, char_name: str) -> dict:
         """Fetch a character's pets.
@@ -298,12 +523,9 @@ class BlizzardAPIClient:
         """
         logger.debug("Fetching character pets for %s on %s", char_name, realm_slug)
 
-        name = char_name.lower()
-        url = self._format_url(
-            f"profile/wow/character/{realm_slug}/{name}/collections/pets"
-        )
+        url = self._character_url(realm_slug, char_name, "/collections/pets")
 
-        return await self._request("GET", url, params=self._profile_params)
+        return await self._request("GET", url)
 
     async def get_character_mounts(self, realm_slug: str, char_name: str) -> dict:
         """Fetch a character's mounts.
@@ -320,12 +542,9 @@ class BlizzardAPIClient:
         """
         logger.debug("Fetching character mounts for %s on %s", char_name, realm_slug)
 
-        name = char_name.lower()
-        url = self._format_url(
-            f"profile/wow/character/{realm_slug}/{name}/collections/mounts"
-        )
+        url = self._character_url(realm_slug, char_name, "/collections/mounts")
 
-        return await self._request("GET", url, params=self._profile_params)
+        return await self._request("GET", url)
 
     async def get_playable_classes(self) -> list[PlayableClass]:
         """Fetch all playable classes from the game.
@@ -1,7 +1,11 @@
+import atexit
+import copy
 import logging
 import os
+import queue
 import sys
 import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
 from pythonjsonlogger.json import JsonFormatter
 
@@ -10,16 +14,134 @@ from groster.constants import resolve_log_path
 
 logger = logging.getLogger(__name__)
 
+# Records buffered for the log file before they are written in one batch
+_FILE_BUFFER_CAPACITY = 256
+
+# Longest time a buffered record waits for the next batch, in seconds
+_FILE_BUFFER_MAX_AGE = 1.0
+
+# Queue handler installed on the root logger and the listener draining it,
+# kept so a repeated setup_logging() call can retire them
+_active: list[tuple[QueueHandler, QueueListener]] = []
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener running in the same process.
+
+    The stock QueueHandler pre-formats records and drops exc_info so they can
+    be pickled. Records here never leave the process, so only the message is
+    merged with its arguments (freezing mutable args) and the exception info
+    is kept for the real handlers' formatters.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedFileHandler(MemoryHandler):
+    """Batch records for a file handler instead of flushing each one.
+
+    The buffer is written when it is full, when a record at ERROR or above
+    arrives, or when logging shuts down. Under steady traffic it is also
+    written once the oldest buffered record is a second old; while the
+    queue is idle, _FlushingQueueListener flushes it instead.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__(_FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=target)
+        self._oldest: float | None = None
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        if self._oldest is None:
+            self._oldest = record.created
+        return (
+            super().shouldFlush(record)
+            or record.created - self._oldest >= _FILE_BUFFER_MAX_AGE
+        )
+
+    def flush(self) -> None:
+        super().flush()
+        self._oldest = None
+
+    def close(self) -> None:
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+class _FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue goes idle.
+
+    Waiting for the next record times out after a second, so records held by
+    a buffering handler are written even if no further record ever arrives.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._records = log_queue
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self._records.get(block, timeout=_FILE_BUFFER_MAX_AGE)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _queue_handlers(
+    handlers: list[logging.Handler],
+) -> tuple[QueueHandler, QueueListener]:
+    """Put handlers behind a queue drained by a background listener thread.
+
+    Args:
+        handlers: Handlers that perform the actual formatting and I/O.
+
+    Returns:
+        The handler to install on the root logger and the (not yet started)
+        listener that forwards queued records to the given handlers.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = _FlushingQueueListener(log_queue, *handlers)
+    return _LocalQueueHandler(log_queue), listener
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Drain a listener's queue, stop its thread and close its handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_active_listener() -> None:
+    """Stop the listener started by setup_logging(), if any."""
+    while _active:
+        _stop_listener(_active.pop()[1])
+
 
 def setup_logging(debug: bool = False) -> None:
     """Configure logging for the application.
 
+    Log records are handed to a queue and written by a background thread, so
+    stream and file I/O never blocks the event loop.
+
     Args:
         debug: If True, enable debug logging for httpx/httpcore requests.
     """
     log_level = logging.DEBUG if debug else logging.INFO
     log_format = os.environ.get("GROSTER_LOG_FORMAT", "text").lower()
 
+    handlers: list[logging.Handler]
     if log_format == "json":
         handler = logging.StreamHandler(sys.stdout)
         formatter = JsonFormatter(
@@ -41,18 +163,33 @@ def setup_logging(debug: bool = False) -> None:
         formatter.default_time_format = "%Y-%m-%dT%H:%M:%S"
         formatter.default_msec_format = "%s.%03dZ"
         handler.setFormatter(formatter)
-        logging.basicConfig(level=log_level, handlers=[handler])
+        handlers = [handler]
     else:
         log_path = resolve_log_path()
-        logging.basicConfig(
-            level=log_level,
-            format="[%(asctime)s] [%(levelname)s] - %(message)s",
+        text_formatter = logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(log_path, encoding="utf-8"),
-            ],
         )
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(text_formatter)
+        file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
+        file_handler.setFormatter(text_formatter)
+        handlers = [stream_handler, _BufferedFileHandler(file_handler)]
+
+    previous = _active.pop() if _active else None
+    queue_handler, listener = _queue_handlers(handlers)
+    listener.start()
+    if previous is not None:
+        logging.getLogger().removeHandler(previous[0])
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
+    _active.append((queue_handler, listener))
+    # A repeated setup replaces the previous listener instead of leaking it
+    if previous is not None:
+        _stop_listener(previous[1])
+
+    # Drain and flush whatever is still queued when the process exits
+    atexit.unregister(_stop_active_listener)
+    atexit.register(_stop_active_listener)
 
     if not debug:
         # Reduce httpx/httpcore logging noise - only show WARNING and above
@@ -280,22 +280,6 @@ class RosterRepository(ABC):
                 an error occurs during dashboard generation.
         """
 
-    @abstractmethod
-    async def get_alt_summary(
-        self, region: str, realm: str, guild: str
-    ) -> tuple[int, int] | None:
-        """Retrieve a summary of alt detection results.
-
-        Args:
-            region: The region identifier (e.g., 'eu', 'us').
-            realm: The realm slug.
-            guild: The guild slug.
-
-        Returns:
-            A tuple of (total_alts, total_mains), or None if the alts
-            data is not available or cannot be read.
-        """
-
     @abstractmethod
     async def get_alts_per_main(
         self, region: str, realm: str, guild: str
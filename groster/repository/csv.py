@@ -1,8 +1,11 @@
+import asyncio
+import csv
+import hashlib
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import pandas as pd
 
@@ -12,6 +15,78 @@ from groster.utils import data_path
 
 logger = logging.getLogger(__name__)
 
+# Dashboard columns in output order, mapped from their joined source names
+_DASHBOARD_COLUMNS = {
+    "name": "Name",
+    "realm": "Realm",
+    "level": "Level",
+    "Class": "Class",
+    "Race": "Race",
+    "Rank": "Rank",
+    "total_quantity": "AQ",
+    "total_points": "AP",
+    "alt": "Alt?",
+    "main": "Main",
+    "ilvl": "iLvl",
+    "last_login": "Last Login",
+    "rio_link": "Raider.io",
+    "armory_link": "Armory",
+    "warcraft_logs_link": "Logs",
+}
+
+
+def _write_records(path: Path, records: list[dict[str, Any]]) -> None:
+    """Write records to a CSV file with a header row, without pandas."""
+    fieldnames = list(dict.fromkeys(key for record in records for key in record))
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write a JSON document in one call, using the C-accelerated compact encoder.
+
+    Blocking; the async repository methods run it in a worker thread so disk
+    writes do not stall the event loop. If the parent directory was removed
+    after the repository created it, it is created again.
+    """
+    content = json.dumps(data, ensure_ascii=False)
+    try:
+        path.write_text(content, encoding="utf-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+def _hash_files(paths: list[Path]) -> str:
+    """Return a digest over the names and contents of the given files."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        content = path.read_bytes()
+        digest.update(f"{path.name}:{len(content)}\n".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def _drop_duplicate_keys(df: pd.DataFrame, key: list[str], path: Path) -> pd.DataFrame:
+    """Keep the last row per key, logging the keys that were duplicated."""
+    duplicated = df.duplicated(subset=key, keep="last")
+    if duplicated.any():
+        logger.warning(
+            "Dropping duplicate rows for %s in %s",
+            sorted(set(map(tuple, df.loc[duplicated, key].to_numpy().tolist()))),
+            path,
+        )
+        df = df[~duplicated]
+    return df
+
+
+def _read_id_name_map(path: Path) -> dict[int, str]:
+    """Read a two-column id/name CSV file into an ID-to-name mapping."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return {int(row["id"]): row["name"] for row in csv.DictReader(f)}
+
 
 class CsvRosterRepository(RosterRepository):
     """CSV-based implementation of RosterRepository.
@@ -20,8 +95,33 @@ class CsvRosterRepository(RosterRepository):
     """
 
     def __init__(self, base_path: Path):
-        self.base_path = base_path
+        # Resolve once so every derived file path is already absolute for logging
+        self.base_path = base_path.resolve()
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._character_dirs: set[Path] = set()
+        self._id_name_maps: dict[Path, tuple[tuple[int, int], dict[int, str]]] = {}
+
+    def _load_id_name_map(self, path: Path) -> dict[int, str]:
+        """Return an ID-to-name mapping file, re-reading it only when it changes.
+
+        Classes, races and ranks rarely change, so the parsed mapping is kept
+        per file and reused while the file's mtime and size stay the same.
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._id_name_maps.get(path)
+        if cached is None or cached[0] != version:
+            cached = (version, _read_id_name_map(path))
+            self._id_name_maps[path] = cached
+        return dict(cached[1])
+
+    def _character_dir(self, region: str, realm: str, char_name: str) -> Path:
+        """Return a character's data directory, creating it on first use only."""
+        char_path = self.base_path / region / realm / char_name.lower()
+        if char_path not in self._character_dirs:
+            char_path.mkdir(parents=True, exist_ok=True)
+            self._character_dirs.add(char_path)
+        return char_path
 
     async def get_playable_classes(self) -> dict[int, str] | None:
         """Loads playable classes from 'data/classes.csv'.
@@ -37,16 +137,13 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Loading classes from file: %s", classes_file)
-            df = pd.read_csv(classes_file)
-            if df.empty:
+            mapping = self._load_id_name_map(classes_file)
+            if not mapping:
                 logger.warning("Classes file is empty: %s", classes_file)
                 return None
 
-            return cast(
-                dict[int, str],
-                pd.Series(df["name"].values, index=df["id"].astype(int)).to_dict(),
-            )
-        except (pd.errors.EmptyDataError, FileNotFoundError, OSError) as e:
+            return mapping
+        except (OSError, KeyError, ValueError) as e:
             logger.warning(
                 "Failed to read classes file, a new one will be created: %s", e
             )
@@ -65,9 +162,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating classes file: %s", classes_file)
-            df = pd.DataFrame(classes)
-            df.to_csv(classes_file, index=False, encoding="utf-8")
-            logger.info("Classes file successfully created: %s", classes_file.resolve())
+            _write_records(classes_file, classes)
+            logger.info("Classes file successfully created: %s", classes_file)
         except OSError as e:
             raise RuntimeError("Failed to write classes file") from e
 
@@ -85,16 +181,13 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Loading races from file: %s", races_file)
-            df = pd.read_csv(races_file)
-            if df.empty:
+            mapping = self._load_id_name_map(races_file)
+            if not mapping:
                 logger.warning("Races file is empty: %s", races_file)
                 return None
 
-            return cast(
-                dict[int, str],
-                pd.Series(df["name"].values, index=df["id"].astype(int)).to_dict(),
-            )
-        except (pd.errors.EmptyDataError, FileNotFoundError, OSError) as e:
+            return mapping
+        except (OSError, KeyError, ValueError) as e:
             logger.warning(
                 "Failed to read races file, a new one will be created: %s", e
             )
@@ -110,9 +203,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating races file: %s", races_file)
-            df = pd.DataFrame(races)
-            df.to_csv(races_file, index=False, encoding="utf-8")
-            logger.info("Races file successfully created: %s", races_file.resolve())
+            _write_records(races_file, races)
+            logger.info("Races file successfully created: %s", races_file)
         except OSError as e:
             raise RuntimeError("Failed to write races file") from e
 
@@ -137,16 +229,13 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Loading ranks from file: %s", ranks_file)
-            df = pd.read_csv(ranks_file)
-            if df.empty:
+            mapping = self._load_id_name_map(ranks_file)
+            if not mapping:
                 logger.warning("Ranks file is empty: %s", ranks_file)
                 return None
 
-            return cast(
-                dict[int, str],
-                pd.Series(df["name"].values, index=df["id"].astype(int)).to_dict(),
-            )
-        except (pd.errors.EmptyDataError, FileNotFoundError, OSError) as e:
+            return mapping
+        except (OSError, KeyError, ValueError) as e:
             logger.warning(
                 "Failed to read ranks file, a new one will be created: %s", e
             )
@@ -167,9 +256,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating ranks file: %s", ranks_file)
-            df = pd.DataFrame(ranks)
-            df.to_csv(ranks_file, index=False, encoding="utf-8")
-            logger.info("Ranks file successfully created: %s", ranks_file.resolve())
+            _write_records(ranks_file, ranks)
+            logger.info("Ranks file successfully created: %s", ranks_file)
         except OSError as e:
             raise RuntimeError("Failed to write ranks file") from e
 
@@ -188,9 +276,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating links file: %s", links_file)
-            df = pd.DataFrame(links_data)
-            df.to_csv(links_file, index=False, encoding="utf-8")
-            logger.info("Links file successfully created: %s", links_file.resolve())
+            _write_records(links_file, links_data)
+            logger.info("Links file successfully created: %s", links_file)
         except OSError as e:
             logger.warning("Failed to process links file: %s", e)
 
@@ -209,9 +296,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating roster file: %s", roster_file)
-            df = pd.DataFrame(roster_data)
-            df.to_csv(roster_file, index=False, encoding="utf-8")
-            logger.info("Roster file successfully created: %s", roster_file.resolve())
+            _write_records(roster_file, roster_data)
+            logger.info("Roster file successfully created: %s", roster_file)
         except OSError as e:
             raise RuntimeError("Failed to write roster file") from e
 
@@ -258,17 +344,13 @@ class CsvRosterRepository(RosterRepository):
             realm: The realm slug.
             char_name: The character's name.
         """
-        char_path = self.base_path / region / realm / char_name.lower()
-        char_path.mkdir(parents=True, exist_ok=True)
+        char_path = self._character_dir(region, realm, char_name)
         profile_file = char_path / "profile.json"
 
         try:
             logger.debug("Creating profile file for %s: %s", char_name, profile_file)
-            with open(profile_file, "w", encoding="utf-8") as f:
-                json.dump(profile_data, f, ensure_ascii=False, indent=4)
-            logger.debug(
-                "Profile file successfully created: %s", profile_file.resolve()
-            )
+            await asyncio.to_thread(_write_json, profile_file, profile_data)
+            logger.debug("Profile file successfully created: %s", profile_file)
         except OSError as exc:
             logger.warning("Failed to process profile file for %s: %s", char_name, exc)
 
@@ -287,15 +369,13 @@ class CsvRosterRepository(RosterRepository):
             realm: The realm slug.
             character_name: The character's name.
         """
-        char_path = self.base_path / region / realm / character_name.lower()
-        char_path.mkdir(parents=True, exist_ok=True)
+        char_path = self._character_dir(region, realm, character_name)
         pets_file = char_path / "pets.json"
 
         try:
             logger.debug("Creating pets file for %s: %s", character_name, pets_file)
-            with open(pets_file, "w", encoding="utf-8") as f:
-                json.dump(pets_data, f, ensure_ascii=False, indent=4)
-            logger.debug("Pets file successfully created: %s", pets_file.resolve())
+            await asyncio.to_thread(_write_json, pets_file, pets_data)
+            logger.debug("Pets file successfully created: %s", pets_file)
         except OSError as exc:
             logger.warning(
                 "Failed to process pets file for %s: %s", character_name, exc
@@ -316,15 +396,13 @@ class CsvRosterRepository(RosterRepository):
             realm: The realm slug.
             character_name: The character's name.
         """
-        char_path = self.base_path / region / realm / character_name.lower()
-        char_path.mkdir(parents=True, exist_ok=True)
+        char_path = self._character_dir(region, realm, character_name)
         mounts_file = char_path / "mounts.json"
 
         try:
             logger.debug("Creating mounts file for %s: %s", character_name, mounts_file)
-            with open(mounts_file, "w", encoding="utf-8") as f:
-                json.dump(mounts_data, f, ensure_ascii=False, indent=4)
-            logger.debug("Mounts file successfully created: %s", mounts_file.resolve())
+            await asyncio.to_thread(_write_json, mounts_file, mounts_data)
+            logger.debug("Mounts file successfully created: %s", mounts_file)
         except OSError as exc:
             logger.warning(
                 "Failed to process mounts file for %s: %s", character_name, exc
@@ -345,8 +423,7 @@ class CsvRosterRepository(RosterRepository):
             realm: The realm slug.
             char_name: The character's name.
         """
-        char_path = self.base_path / region / realm / char_name.lower()
-        char_path.mkdir(parents=True, exist_ok=True)
+        char_path = self._character_dir(region, realm, char_name)
         achievements_file = char_path / "achievements.json"
 
         try:
@@ -355,11 +432,10 @@ class CsvRosterRepository(RosterRepository):
                 char_name,
                 achievements_file,
             )
-            with open(achievements_file, "w", encoding="utf-8") as f:
-                json.dump(achievements_data, f, ensure_ascii=False, indent=4)
+            await asyncio.to_thread(_write_json, achievements_file, achievements_data)
             logger.debug(
                 "Achievements file successfully created: %s",
-                achievements_file.resolve(),
+                achievements_file,
             )
         except OSError as exc:
             logger.warning(
@@ -417,9 +493,8 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating alts file: %s", alts_file)
-            df = pd.DataFrame(alts_data)
-            df.to_csv(alts_file, index=False, encoding="utf-8")
-            logger.info("Alts file successfully created: %s", alts_file.resolve())
+            _write_records(alts_file, alts_data)
+            logger.info("Alts file successfully created: %s", alts_file)
         except OSError as e:
             raise RuntimeError("Failed to write alts file") from e
 
@@ -507,27 +582,46 @@ class CsvRosterRepository(RosterRepository):
 
         try:
             logger.info("Creating achievements summary file: %s", achievements_file)
-            df = pd.DataFrame(summary_data)
-            if "fingerprint_source" not in df.columns:
-                df["fingerprint_source"] = "api"
-            df = df[
-                ["id", "name", "total_quantity", "total_points", "fingerprint_source"]
+            records = [
+                {
+                    "id": summary["id"],
+                    "name": summary["name"],
+                    "total_quantity": summary["total_quantity"],
+                    "total_points": summary["total_points"],
+                    "fingerprint_source": summary.get("fingerprint_source", "api"),
+                }
+                for summary in summary_data
             ]
-            df.to_csv(achievements_file, index=False, encoding="utf-8")
+            _write_records(achievements_file, records)
             logger.info(
                 "Achievements summary file successfully created: %s",
-                achievements_file.resolve(),
+                achievements_file,
             )
         except OSError as e:
             raise RuntimeError("Failed to write achievements summary file") from e
         except KeyError as e:
             raise RuntimeError("Invalid achievement summary data structure") from e
 
+    @staticmethod
+    def _dashboard_is_current(
+        dashboard_file: Path, digest_file: Path, sources_digest: str
+    ) -> bool:
+        """Check whether the dashboard was built from the given source digest."""
+        if not dashboard_file.exists():
+            return False
+        try:
+            return digest_file.read_text(encoding="utf-8") == sources_digest
+        except OSError:
+            return False
+
     async def build_dashboard(self, region: str, realm: str, guild: str) -> None:
         """Build and persist a consolidated dashboard from source data files.
 
         Reads roster, links, alts, achievements, classes, races, and ranks
         data, merges them into a single dashboard, and persists the result.
+        If the source files have the same contents as when the dashboard was
+        last built, the existing dashboard is kept and only its modification
+        time is refreshed.
 
         Args:
             region: The region identifier (e.g., 'eu', 'us').
@@ -550,83 +644,89 @@ class CsvRosterRepository(RosterRepository):
             classes_file = data_path(self.base_path, "classes")
             races_file = data_path(self.base_path, "races")
             ranks_file = data_path(self.base_path, region, realm, guild, "ranks")
-
-            df_roster = pd.read_csv(roster_file)
-            df_links = pd.read_csv(links_file)
-            df_alts = pd.read_csv(alts_file)
-            df_achievements = pd.read_csv(
-                achievements_file,
-                usecols=[
-                    "id",
-                    "name",
-                    "total_quantity",
-                    "total_points",
-                ],
-            )
-
-            df_classes = pd.read_csv(classes_file).rename(
-                columns={"id": "class_id", "name": "Class"}
+            dashboard_file = data_path(
+                self.base_path, region, realm, guild, "dashboard"
             )
-            df_races = pd.read_csv(races_file).rename(
-                columns={"id": "race_id", "name": "Race"}
+            digest_file = dashboard_file.with_suffix(".sources")
+
+            sources_digest = await asyncio.to_thread(
+                _hash_files,
+                [
+                    roster_file,
+                    links_file,
+                    alts_file,
+                    achievements_file,
+                    classes_file,
+                    races_file,
+                    ranks_file,
+                ],
             )
-            df_ranks = pd.read_csv(ranks_file).rename(
-                columns={"id": "rank", "name": "Rank"}
+            if self._dashboard_is_current(dashboard_file, digest_file, sources_digest):
+                # The bot reports the dashboard mtime as the last roster update
+                dashboard_file.touch()
+                logger.info("Dashboard sources unchanged, keeping: %s", dashboard_file)
+                return
+
+            # The source files are independent, so parse them in parallel
+            # worker threads instead of one after another on the event loop
+            df_roster, df_links, df_alts, df_achievements = await asyncio.gather(
+                asyncio.to_thread(pd.read_csv, roster_file),
+                asyncio.to_thread(pd.read_csv, links_file),
+                asyncio.to_thread(pd.read_csv, alts_file),
+                asyncio.to_thread(
+                    pd.read_csv,
+                    achievements_file,
+                    usecols=[
+                        "id",
+                        "name",
+                        "total_quantity",
+                        "total_points",
+                    ],
+                ),
             )
 
-            dashboard_df = pd.merge(df_roster, df_links, on=["id", "name"])
-            dashboard_df = pd.merge(dashboard_df, df_alts, on=["id", "name"])
-            dashboard_df = pd.merge(
-                dashboard_df, df_achievements, on=["id", "name"], how="left"
+            class_map = self._load_id_name_map(classes_file)
+            race_map = self._load_id_name_map(races_file)
+            rank_map = self._load_id_name_map(ranks_file)
+
+            # Index every per-character frame on the shared key once and
+            # join on it, instead of re-hashing (id, name) for each merge.
+            # Each file should hold one row per character; a duplicated key
+            # keeps its last row rather than multiplying dashboard rows.
+            key = ["id", "name"]
+            df_roster, df_links, df_alts, df_achievements = (
+                _drop_duplicate_keys(df, key, path)
+                for df, path in (
+                    (df_roster, roster_file),
+                    (df_links, links_file),
+                    (df_alts, alts_file),
+                    (df_achievements, achievements_file),
+                )
             )
-
-            dashboard_df = pd.merge(dashboard_df, df_classes, on="class_id", how="left")
-            dashboard_df = pd.merge(dashboard_df, df_races, on="race_id", how="left")
-            dashboard_df = pd.merge(dashboard_df, df_ranks, on="rank", how="left")
-
-            dashboard_df = dashboard_df.rename(
-                columns={
-                    "name": "Name",
-                    "realm": "Realm",
-                    "level": "Level",
-                    "total_quantity": "AQ",
-                    "total_points": "AP",
-                    "alt": "Alt?",
-                    "main": "Main",
-                    "ilvl": "iLvl",
-                    "last_login": "Last Login",
-                    "rio_link": "Raider.io",
-                    "armory_link": "Armory",
-                    "warcraft_logs_link": "Logs",
-                }
+            dashboard_df = (
+                df_roster.set_index(key)
+                .join(df_links.set_index(key), how="inner", validate="one_to_one")
+                .join(df_alts.set_index(key), how="inner", validate="one_to_one")
+                .join(
+                    df_achievements.set_index(key),
+                    how="left",
+                    validate="one_to_one",
+                )
+                .reset_index()
             )
 
-            final_columns = [
-                "Name",
-                "Realm",
-                "Level",
-                "Class",
-                "Race",
-                "Rank",
-                "AQ",
-                "AP",
-                "Alt?",
-                "Main",
-                "iLvl",
-                "Last Login",
-                "Raider.io",
-                "Armory",
-                "Logs",
-            ]
-            dashboard_df = dashboard_df[final_columns]
+            dashboard_df["Class"] = dashboard_df["class_id"].map(class_map)
+            dashboard_df["Race"] = dashboard_df["race_id"].map(race_map)
+            dashboard_df["Rank"] = dashboard_df["rank"].map(rank_map)
 
-            dashboard_file = data_path(
-                self.base_path, region, realm, guild, "dashboard"
+            # Select the dashboard columns first so only they are renamed
+            dashboard_df = dashboard_df[list(_DASHBOARD_COLUMNS)].rename(
+                columns=_DASHBOARD_COLUMNS
             )
+
             dashboard_df.to_csv(dashboard_file, index=False, encoding="utf-8")
-            logger.info(
-                "Successfully created dashboard CSV: %s", dashboard_file.resolve()
-            )
+            digest_file.write_text(sources_digest, encoding="utf-8")
+            logger.info("Successfully created dashboard CSV: %s", dashboard_file)
         except FileNotFoundError as e:
             raise RuntimeError(
                 "Failed to generate dashboard: a source CSV file is missing"
@@ -636,36 +736,6 @@ class CsvRosterRepository(RosterRepository):
                 "An unexpected error occurred during dashboard generation"
             ) from e
 
-    async def get_alt_summary(
-        self, region: str, realm: str, guild: str
-    ) -> tuple[int, int] | None:
-        """Retrieve a summary of alt detection results.
-
-        Args:
-            region: The region identifier (e.g., 'eu', 'us').
-            realm: The realm slug.
-            guild: The guild slug.
-
-        Returns:
-            A tuple of (total_alts, total_mains), or None if the alts
-            data is not available or cannot be read.
-        """
-        alts_file = data_path(self.base_path, region, realm, guild, "alts")
-
-        try:
-            alts_df = pd.read_csv(alts_file)
-            total_alts = int(alts_df["alt"].sum())
-            total_mains = len(alts_df["main"].unique())
-            return (total_alts, total_mains)
-        except (
-            FileNotFoundError,
-            pd.errors.EmptyDataError,
-            pd.errors.ParserError,
-            KeyError,
-        ):
-            logger.exception("Failed to read alts data for summary")
-            return None
-
     async def get_alts_per_main(
         self, region: str, realm: str, guild: str
     ) -> list[tuple[str, str, int]] | None:
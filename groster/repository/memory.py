@@ -232,19 +232,6 @@ class InMemoryRosterRepository(RosterRepository):
         self._dashboard[key] = dashboard_rows
         self._dashboard_modified[key] = datetime.now(tz=UTC)
 
-    async def get_alt_summary(
-        self, region: str, realm: str, guild: str
-    ) -> tuple[int, int] | None:
-        """Retrieve a summary of alt detection results."""
-        key = self._guild_key(region, realm, guild)
-        alts = self._alts.get(key)
-        if not alts:
-            return None
-
-        total_alts = sum(1 for row in alts if row.get("alt"))
-        total_mains = len({row["main"] for row in alts})
-        return (total_alts, total_mains)
-
     async def get_alts_per_main(
         self, region: str, realm: str, guild: str
     ) -> list[tuple[str, str, int]] | None:
@@ -1,5 +1,8 @@
 import asyncio
 import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import Set as AbstractSet
 from typing import Any
 
 from groster.constants import (
@@ -13,6 +16,39 @@ from groster.utils import format_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Blizzard caps API requests at 100 per second
+_REQUESTS_PER_SECOND = 50
+
+_FINGERPRINT_ID_COUNT = len(FINGERPRINT_ACHIEVEMENT_IDS)
+
+
+async def _gather_rate_limited[T](
+    awaitables: Iterable[Awaitable[T]],
+    limit: int = _REQUESTS_PER_SECOND,
+) -> list[T]:
+    """Run awaitables concurrently, starting at most ``limit`` per second.
+
+    Each awaitable holds one of ``limit`` slots for at least one second, so a
+    slow response only delays its own slot instead of stalling a whole batch.
+    Results are returned in input order, like ``asyncio.gather``.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        await semaphore.acquire()
+        started_at = loop.time()
+        try:
+            return await awaitable
+        finally:
+            remaining = started_at + 1 - loop.time()
+            if remaining > 0:
+                loop.call_later(remaining, semaphore.release)
+            else:
+                semaphore.release()
+
+    return await asyncio.gather(*(run(a) for a in awaitables))
+
 
 async def fetch_member_fingerprint(
     client: BlizzardAPIClient, member: dict
@@ -65,21 +101,20 @@ async def fetch_member_fingerprint(
             "total_points": total_points,
         }
 
-    timestamps = {
-        ach["id"]: ach.get("completed_timestamp")
-        for ach in ach_data["achievements"]
-        if ach.get("id") in FINGERPRINT_ACHIEVEMENT_IDS
-    }
-
-    # Explicitly add Level 10 achievement for main detection
-    level_10_ts = next(
-        (
-            ach.get("completed_timestamp")
-            for ach in ach_data["achievements"]
-            if ach.get("id") == LEVEL_10_ACHIEVEMENT_ID
-        ),
-        None,
-    )
+    # Collect fingerprint timestamps and the Level 10 achievement (used for
+    # main detection) in a single pass, stopping once every target is found.
+    timestamps = {}
+    level_10_ts = None
+    for ach in ach_data["achievements"]:
+        ach_id = ach.get("id")
+        if ach_id in FINGERPRINT_ACHIEVEMENT_IDS:
+            timestamps[ach_id] = ach.get("completed_timestamp")
+        elif ach_id == LEVEL_10_ACHIEVEMENT_ID and level_10_ts is None:
+            level_10_ts = ach.get("completed_timestamp")
+        else:
+            continue
+        if level_10_ts is not None and len(timestamps) == _FINGERPRINT_ID_COUNT:
+            break
 
     if level_10_ts:
         timestamps[LEVEL_10_ACHIEVEMENT_ID] = level_10_ts
@@ -100,34 +135,23 @@ async def fetch_member_fingerprint(
     }
 
 
-def _build_member_records(
-    members: list[dict[str, Any]],
-    profile_data: dict[str, dict[str, Any]],
-) -> list[dict[str, Any]]:
-    """Build processed roster records from raw member and profile data."""
-    processed: list[dict[str, Any]] = []
-    for member in members:
-        character = member.get("character", {})
-        name = character.get("name")
-        profile = profile_data.get(name, {})
-
-        if not profile:
-            continue
-
-        processed.append(
-            {
-                "id": character.get("id"),
-                "name": name,
-                "realm": character.get("realm", {}).get("slug"),
-                "level": character.get("level"),
-                "class_id": character.get("playable_class", {}).get("id"),
-                "race_id": character.get("playable_race", {}).get("id"),
-                "rank": member.get("rank"),
-                "ilvl": profile.get("ilvl", 0),
-                "last_login": format_timestamp(profile.get("last_login")),
-            }
-        )
-    return processed
+def _build_member_record(
+    member: dict[str, Any],
+    profile: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a processed roster record from a raw member and its profile."""
+    character = member.get("character", {})
+    return {
+        "id": character.get("id"),
+        "name": character.get("name"),
+        "realm": character.get("realm", {}).get("slug"),
+        "level": character.get("level"),
+        "class_id": character.get("playable_class", {}).get("id"),
+        "race_id": character.get("playable_race", {}).get("id"),
+        "rank": member.get("rank"),
+        "ilvl": profile.get("equipped_item_level"),
+        "last_login": format_timestamp(profile.get("last_login_timestamp")),
+    }
 
 
 async def fetch_roster_details(
@@ -173,13 +197,10 @@ async def fetch_roster_details(
 
     logger.info("Fetching profiles for %d members", len(members_to_fetch))
 
-    # Blizzard caps API requests at 100 per second
-    tasks_limit = 50
-    semaphore = asyncio.Semaphore(tasks_limit)
     raw_profiles: dict[str, dict[str, Any]] = {}
 
     async def fetch_profile(member: dict) -> dict | None:
-        """Coroutine to fetch a single character's profile."""
+        """Coroutine to fetch a single character's profile as a roster record."""
         char_info = member.get("character", {})
         realm = char_info.get("realm", {}).get("slug")
         name = char_info.get("name")
@@ -188,39 +209,19 @@ async def fetch_roster_details(
             logger.warning("No realm or name found for member: %s", member)
             return None
 
-        async with semaphore:
-            try:
-                response = await client.get_character_profile(realm, name)
-            except BlizzardAPIError:
-                return None
-            await asyncio.sleep(0.01)
+        try:
+            response = await client.get_character_profile(realm, name)
+        except BlizzardAPIError:
+            return None
 
         raw_profiles[name] = response
 
-        return {
-            "name": response.get("name"),
-            "id": response.get("id"),
-            "last_login": response.get("last_login_timestamp"),
-            "ilvl": response.get("equipped_item_level"),
-        }
-
-    # Split tasks into batches to respect rate limits
-    tasks = [fetch_profile(member) for member in members_to_fetch]
-    profile_results = []
+        return _build_member_record(member, response)
 
-    for i in range(0, len(tasks), tasks_limit):
-        batch = tasks[i : i + tasks_limit]
-        batch_results = await asyncio.gather(*batch)
-        profile_results.extend(batch_results)
-
-        # Sleep for 1 second between batches to respect rate limits
-        if i + tasks_limit < len(tasks):
-            await asyncio.sleep(1)
-
-    profile_data = {p["name"]: p for p in profile_results if p}
-
-    logger.info("Processing %d guild members", len(members))
-    processed_data = _build_member_records(members, profile_data)
+    profile_results = await _gather_rate_limited(
+        fetch_profile(member) for member in members_to_fetch
+    )
+    processed_data = [record for record in profile_results if record]
 
     logger.info(
         "Successfully processed details for %d out of %d members.",
@@ -269,7 +270,10 @@ def build_profile_links(
     links_data = []
     locale = _armory_locale(region)
 
-    armory_base = "https://worldofwarcraft.blizzard.com"
+    # Only the character part of each link varies per member
+    rio_base = f"https://raider.io/characters/{region}/"
+    armory_base = f"https://worldofwarcraft.blizzard.com/{locale}/character/{region}/"
+    logs_base = f"https://www.warcraftlogs.com/character/{region}/"
 
     for member in members:
         character = member.get("character", {})
@@ -282,10 +286,10 @@ def build_profile_links(
             )
             continue
 
-        fq_name = f"{region}/{realm}/{name.lower()}"
-        rio = f"https://raider.io/characters/{fq_name}"
-        armory = f"{armory_base}/{locale}/character/{fq_name}"
-        logs = f"https://www.warcraftlogs.com/character/{fq_name}"
+        char_path = f"{realm}/{name.lower()}"
+        rio = rio_base + char_path
+        armory = armory_base + char_path
+        logs = logs_base + char_path
         links_data.append(
             {
                 "id": character.get("id"),
@@ -383,20 +387,21 @@ async def fetch_playable_races(client: BlizzardAPIClient) -> list[dict[str, Any]
     return [{"id": r["id"], "name": r["name"]} for r in races_list]
 
 
-async def fetch_member_pets_summary(
-    client: BlizzardAPIClient, member: dict
+async def _fetch_member_collection(
+    member: dict,
+    fetch: Callable[[str, str], Awaitable[dict]],
+    key: str,
 ) -> tuple[dict | None, dict | None]:
-    """Fetch pet collection summary for one member.
+    """Fetch one collection endpoint for a member and count its entries.
 
     Args:
-        client: Blizzard API client for fetching pet data.
         member: Raw member dict from roster data containing character info.
+        fetch: Client method taking (realm_slug, char_name) for the collection.
+        key: Collection key in the response, also used as the summary count key.
 
     Returns:
-        Tuple of
-        - pet summary dict
-        - raw pet data dict
-        or (None, None) if member data is invalid.
+        Tuple of (summary dict, raw collection data), or (None, None) if member
+        data is invalid or the request fails.
     """
     char_info = member.get("character", {})
     name = char_info.get("name")
@@ -406,7 +411,7 @@ async def fetch_member_pets_summary(
         return None, None
 
     try:
-        data = await client.get_character_pets(realm, name)
+        data = await fetch(realm, name)
     except BlizzardAPIError:
         return None, None
 
@@ -414,12 +419,30 @@ async def fetch_member_pets_summary(
         "id": char_id,
         "name": name,
         "realm": realm,
-        "pets": len(data.get("pets", [])),
+        key: len(data.get(key, [])),
     }
 
     return summary, data
 
 
+async def fetch_member_pets_summary(
+    client: BlizzardAPIClient, member: dict
+) -> tuple[dict | None, dict | None]:
+    """Fetch pet collection summary for one member.
+
+    Args:
+        client: Blizzard API client for fetching pet data.
+        member: Raw member dict from roster data containing character info.
+
+    Returns:
+        Tuple of
+        - pet summary dict
+        - raw pet data dict
+        or (None, None) if member data is invalid.
+    """
+    return await _fetch_member_collection(member, client.get_character_pets, "pets")
+
+
 async def fetch_member_mounts_summary(
     client: BlizzardAPIClient, member: dict
 ) -> tuple[dict | None, dict | None]:
@@ -435,40 +458,23 @@ async def fetch_member_mounts_summary(
         - raw mount data dict
         or (None, None) if member data is invalid.
     """
-    char_info = member.get("character", {})
-    name = char_info.get("name")
-    realm = char_info.get("realm", {}).get("slug")
-    char_id = char_info.get("id")
-    if not all([name, realm, char_id]):
-        return None, None
-
-    try:
-        data = await client.get_character_mounts(realm, name)
-    except BlizzardAPIError:
-        return None, None
-
-    summary = {
-        "id": char_id,
-        "name": name,
-        "realm": realm,
-        "mounts": len(data.get("mounts", [])),
-    }
-
-    return summary, data
+    return await _fetch_member_collection(member, client.get_character_mounts, "mounts")
 
 
 def compute_jaccard_similarity(
-    fingerprint_a: set[tuple[int, int]],
-    fingerprint_b: set[tuple[int, int]],
+    fingerprint_a: AbstractSet[tuple[int, int]],
+    fingerprint_b: AbstractSet[tuple[int, int]],
 ) -> float:
     """Compute Jaccard similarity between two achievement fingerprints.
 
     Returns 0.0 when both sets are empty.
     """
-    union_size = len(fingerprint_a | fingerprint_b)
+    # The union size follows from the intersection, so no union set is built
+    intersection_size = len(fingerprint_a & fingerprint_b)
+    union_size = len(fingerprint_a) + len(fingerprint_b) - intersection_size
     if union_size == 0:
         return 0.0
-    return len(fingerprint_a & fingerprint_b) / union_size
+    return intersection_size / union_size
 
 
 def _extract_raw_factor(char: dict, factor: str) -> float | None:
@@ -482,21 +488,21 @@ def _extract_raw_factor(char: dict, factor: str) -> float | None:
     return float(char.get(factor, 0))
 
 
-def _score_main_candidate(
-    char: dict,
+def _score_raw_factors(
+    raw_factors: dict[str, float | None],
     group_mins: dict[str, float],
     group_ranges: dict[str, float],
 ) -> float:
     """Compute a weighted composite score for a main-character candidate.
 
-    Each factor is normalized to 0.0–1.0 within the group, then multiplied
-    by its weight from ``MAIN_SCORE_WEIGHTS``. Lower-is-better factors
-    (``level_10_timestamp``, ``character_id``) are inverted after
-    normalization.
+    Each raw factor is normalized to 0.0–1.0 within the group, then
+    multiplied by its weight from ``MAIN_SCORE_WEIGHTS``. Lower-is-better
+    factors (``level_10_timestamp``, ``character_id``) are inverted after
+    normalization, and a missing factor contributes nothing.
     """
     score = 0.0
     for factor, weight in MAIN_SCORE_WEIGHTS.items():
-        raw = _extract_raw_factor(char, factor)
+        raw = raw_factors[factor]
         if raw is None:
             normalized = 0.0
         elif group_ranges[factor] == 0.0:
@@ -525,14 +531,18 @@ def _find_main_in_group(group: list[dict]) -> str:
     if len(group) == 1:
         return str(group[0]["name"])
 
+    # Extract every factor once per character; scoring reuses these values
+    raw_factors = [
+        {factor: _extract_raw_factor(char, factor) for factor in MAIN_SCORE_WEIGHTS}
+        for char in group
+    ]
+
     # Compute per-factor min and range across the group
     group_mins: dict[str, float] = {}
     group_ranges: dict[str, float] = {}
 
     for factor in MAIN_SCORE_WEIGHTS:
-        values = [
-            v for char in group if (v := _extract_raw_factor(char, factor)) is not None
-        ]
+        values = [v for raw in raw_factors if (v := raw[factor]) is not None]
         if values:
             min_val = min(values)
             max_val = max(values)
@@ -543,11 +553,14 @@ def _find_main_in_group(group: list[dict]) -> str:
             group_ranges[factor] = 0.0
 
     # Score each character and pick the winner
-    scored = sorted(
-        group,
-        key=lambda c: (-_score_main_candidate(c, group_mins, group_ranges), c["name"]),
+    winner = min(
+        range(len(group)),
+        key=lambda i: (
+            -_score_raw_factors(raw_factors[i], group_mins, group_ranges),
+            group[i]["name"],
+        ),
     )
-    return str(scored[0]["name"])
+    return str(group[winner]["name"])
 
 
 def cluster_characters_by_fingerprint(
@@ -559,34 +572,63 @@ def cluster_characters_by_fingerprint(
     Characters with fewer than 3 fingerprint entries are not compared and
     are placed in their own singleton group. Ordering of the input list
     affects grouping results (greedy algorithm).
+
+    An inverted index from fingerprint entry to character positions limits
+    each comparison to characters sharing at least one entry with the base
+    character, since any other pair has a Jaccard similarity of zero.
+    Fingerprints are encoded as integer bitmasks over the distinct entries
+    seen in the roster, so each comparison is a single AND plus a popcount.
     """
-    groups: list[list[dict]] = []
-    unmatched_chars = list(characters)
+    fingerprints = [frozenset(char["fingerprint"]) for char in characters]
+    sizes = [len(fp) for fp in fingerprints]
+    reliable = [size >= 3 for size in sizes]
+
+    entry_bits: dict[tuple[int, int], int] = {}
+    masks: list[int] = []
+    postings: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for index, fingerprint in enumerate(fingerprints):
+        mask = 0
+        for entry in fingerprint:
+            mask |= 1 << entry_bits.setdefault(entry, len(entry_bits))
+            if reliable[index]:
+                postings[entry].append(index)
+        masks.append(mask)
 
-    while unmatched_chars:
-        base_char = unmatched_chars.pop(0)
-        base_fp = set(base_char["fingerprint"])
+    groups: list[list[dict]] = []
+    unmatched = set(range(len(characters)))
 
+    for base_index, base_char in enumerate(characters):
+        if base_index not in unmatched:
+            continue
+        unmatched.discard(base_index)
         current_group = [base_char]
-        remaining_chars = []
-
-        for char_to_compare in unmatched_chars:
-            compare_fp = set(char_to_compare["fingerprint"])
 
-            # Skip comparison if either fingerprint is too small to be reliable
-            if len(base_fp) < 3 or len(compare_fp) < 3:
-                remaining_chars.append(char_to_compare)
-                continue
-
-            similarity = compute_jaccard_similarity(base_fp, compare_fp)
+        # Skip comparison if the base fingerprint is too small to be reliable
+        if not reliable[base_index]:
+            groups.append(current_group)
+            continue
 
+        base_fp = fingerprints[base_index]
+        base_mask = masks[base_index]
+        base_size = sizes[base_index]
+        if threshold > 0:
+            candidates = sorted(
+                {i for entry in base_fp for i in postings[entry] if i in unmatched}
+            )
+        else:
+            candidates = sorted(i for i in unmatched if reliable[i])
+
+        for index in candidates:
+            # Same ratio as compute_jaccard_similarity(); both sizes are >= 3,
+            # so the union is never empty
+            intersection_size = (base_mask & masks[index]).bit_count()
+            union_size = base_size + sizes[index] - intersection_size
+            similarity = intersection_size / union_size
             if similarity >= threshold:
-                current_group.append(char_to_compare)
-            else:
-                remaining_chars.append(char_to_compare)
+                current_group.append(characters[index])
+                unmatched.discard(index)
 
         groups.append(current_group)
-        unmatched_chars = remaining_chars
 
     return groups
 
@@ -782,22 +824,13 @@ async def identify_alts(
         len(members_to_fetch),
     )
 
-    # Blizzard caps API requests at 100 per second
-    tasks_limit = 50
-    all_tasks: list[Any] = []
+    all_tasks: list[Awaitable[Any]] = []
     for member in members_to_fetch:
         all_tasks.append(fetch_member_fingerprint(client, member))
         all_tasks.append(fetch_member_pets_summary(client, member))
         all_tasks.append(fetch_member_mounts_summary(client, member))
 
-    all_results = []
-    for i in range(0, len(all_tasks), tasks_limit):
-        batch = all_tasks[i : i + tasks_limit]
-        batch_results = await asyncio.gather(*batch)
-        all_results.extend(batch_results)
-
-        if i + tasks_limit < len(all_tasks):
-            await asyncio.sleep(1)
+    all_results = await _gather_rate_limited(all_tasks)
 
     (
         fingerprints_data,
@@ -844,6 +877,7 @@ async def identify_alts(
         if not name:
             continue
 
+        fp_data = fingerprints_data.get(name, {})
         all_char_data.append(
             {
                 "id": char_info.get("id"),
@@ -851,12 +885,10 @@ async def identify_alts(
                 "realm": char_info.get("realm", {}).get("slug"),
                 "pets": pet_summaries.get(name, {}).get("pets", 0),
                 "mounts": mount_summaries.get(name, {}).get("mounts", 0),
-                "fingerprint": fingerprints_data.get(name, {}).get("fingerprint", ()),
-                "timestamps": fingerprints_data.get(name, {}).get("timestamps", {}),
-                "total_points": fingerprints_data.get(name, {}).get("total_points", 0),
-                "total_quantity": fingerprints_data.get(name, {}).get(
-                    "total_quantity", 0
-                ),
+                "fingerprint": fp_data.get("fingerprint", ()),
+                "timestamps": fp_data.get("timestamps", {}),
+                "total_points": fp_data.get("total_points", 0),
+                "total_quantity": fp_data.get("total_quantity", 0),
             }
         )
 
@@ -869,15 +901,18 @@ async def identify_alts(
 
     logger.info("Creating alts data for %d characters...", len(all_char_data))
 
-    alts_data = [
-        {
-            "id": char["id"],
-            "name": (char_name := char["name"]),
-            "alt": char_name != main_character_map.get(char_name, char_name),
-            "main": main_character_map.get(char_name, char_name),
-        }
-        for char in all_char_data
-    ]
+    alts_data = []
+    for char in all_char_data:
+        char_name = char["name"]
+        main_name = main_character_map.get(char_name, char_name)
+        alts_data.append(
+            {
+                "id": char["id"],
+                "name": char_name,
+                "alt": char_name != main_name,
+                "main": main_name,
+            }
+        )
 
     return (
         alts_data,
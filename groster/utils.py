@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -26,6 +27,12 @@ def data_path(base_dir: Path, *args: str) -> Path:
     if not args:
         raise ValueError("At least one path component is required")
 
+    return _data_path_cached(base_dir, args)
+
+
+@lru_cache(maxsize=256)
+def _data_path_cached(base_dir: Path, args: tuple[str, ...]) -> Path:
+    """Build and memoize the data file path for a base directory and components."""
     local_path = "-".join(args).lstrip("/")
     return base_dir / f"{local_path}.csv"
 
@@ -1,9 +1,10 @@
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
+from nacl.signing import SigningKey
 
 os.environ.setdefault(
     "DISCORD_PUBLIC_KEY",
@@ -11,6 +12,8 @@ os.environ.setdefault(
 )
 
 from groster.commands.bot import (
+    MAX_INTERACTION_BODY_SIZE,
+    VERIFY_KEY_APP_KEY,
     _create_app,
     _format_no_character_message,
     _handle_alts,
@@ -18,6 +21,8 @@ from groster.commands.bot import (
     _handle_whois,
     _utf8_len,
     format_alts_embed,
+    format_character_info,
+    interactions_handler,
 )
 from groster.repository import InMemoryRosterRepository
 
@@ -116,6 +121,60 @@ def test_format_no_character_message_empty_suggestions_unchanged():
     assert "Did you mean" not in result
 
 
+def test_format_no_character_message_stale_roster_reports_outdated():
+    result = _format_no_character_message(
+        "Alicestorm", datetime.now() - timedelta(days=2), None
+    )
+
+    assert "The guild roster is outdated." in result
+
+
+def test_format_no_character_message_fresh_roster_not_outdated():
+    result = _format_no_character_message(
+        "Alicestorm", datetime.now() - timedelta(hours=1), None
+    )
+
+    assert "Last date of guild roster update was" in result
+    assert "outdated" not in result
+
+
+# ── format_character_info ─────────────────────────────────────────────────────
+
+
+def test_format_character_info_with_alts_lists_main_then_alts():
+    char_info = {
+        "name": "Alicestorm",
+        "class": "Mage",
+        "realm": "terokkar",
+        "ilvl": 600,
+        "last_login": "2026-01-01",
+        "alts": [
+            {
+                "name": "Alicendra",
+                "class": "Druid",
+                "realm": "terokkar",
+                "ilvl": 590,
+                "last_login": "2026-01-02",
+            }
+        ],
+    }
+
+    result = format_character_info(char_info, "Alicestorm", None, None, "eu")
+
+    assert result == (
+        "**Main:**\n"
+        "🧙 **Alicestorm** — Mage\n"
+        "Realm: terokkar (EU)\n"
+        "iLvl: 600\n"
+        "Last Login: 2026-01-01\n"
+        "\n**Alts:**\n"
+        "🌿 **Alicendra** — Druid\n"
+        "Realm: terokkar (EU)\n"
+        "iLvl: 590\n"
+        "Last Login: 2026-01-02"
+    )
+
+
 # ── _handle_autocomplete ─────────────────────────────────────────────────────
 
 
@@ -423,3 +482,93 @@ async def test_handle_alts_repo_exception_returns_error_message():
     assert payload["type"] == 4
     assert payload["data"]["flags"] == 64
     assert "error occurred" in payload["data"]["content"]
+
+
+# ── interactions_handler ─────────────────────────────────────────────────────
+
+
+def _make_interaction_request(
+    mocker, signing_key: SigningKey, body: bytes, *, signature: str | None = None
+):
+    timestamp = "1700000000"
+    if signature is None:
+        signature = signing_key.sign(timestamp.encode() + body).signature.hex()
+    request = mocker.Mock()
+    request.headers = {
+        "X-Signature-Ed25519": signature,
+        "X-Signature-Timestamp": timestamp,
+    }
+    request.content_length = len(body)
+    request.read = mocker.AsyncMock(return_value=body)
+    request.app = {VERIFY_KEY_APP_KEY: signing_key.verify_key}
+    return request
+
+
+async def test_interactions_handler_valid_signature_answers_ping(mocker):
+    signing_key = SigningKey.generate()
+    request = _make_interaction_request(mocker, signing_key, b'{"type": 1}')
+
+    response = await interactions_handler(request)
+
+    assert response.status == 200
+    assert json.loads(response.body) == {"type": 1}
+
+
+async def test_interactions_handler_ping_command_returns_json_pong(mocker):
+    signing_key = SigningKey.generate()
+    body = b'{"type": 2, "data": {"name": "ping"}}'
+    request = _make_interaction_request(mocker, signing_key, body)
+
+    response = await interactions_handler(request)
+
+    assert response.content_type == "application/json"
+    assert response.charset == "utf-8"
+    assert json.loads(response.body) == {"type": 4, "data": {"content": "pong"}}
+
+
+async def test_interactions_handler_tampered_body_returns_401(mocker):
+    signing_key = SigningKey.generate()
+    signature = signing_key.sign(b'1700000000{"type": 1}').signature.hex()
+    request = _make_interaction_request(
+        mocker, signing_key, b'{"type": 2}', signature=signature
+    )
+
+    response = await interactions_handler(request)
+
+    assert response.status == 401
+
+
+async def test_interactions_handler_wrong_length_signature_skips_body_read(mocker):
+    signing_key = SigningKey.generate()
+    request = _make_interaction_request(
+        mocker, signing_key, b'{"type": 1}', signature="ab" * 10
+    )
+
+    response = await interactions_handler(request)
+
+    assert response.status == 401
+    request.read.assert_not_called()
+
+
+async def test_interactions_handler_non_hex_signature_returns_401(mocker):
+    signing_key = SigningKey.generate()
+    request = _make_interaction_request(
+        mocker, signing_key, b'{"type": 1}', signature="zz" * 64
+    )
+
+    response = await interactions_handler(request)
+
+    assert response.status == 401
+
+
+async def test_interactions_handler_oversized_body_returns_413_without_reading(
+    mocker,
+):
+    signing_key = SigningKey.generate()
+    request = _make_interaction_request(mocker, signing_key, b'{"type": 1}')
+    request.content_length = MAX_INTERACTION_BODY_SIZE + 1
+
+    response = await interactions_handler(request)
+
+    assert response.status == 413
+    request.read.assert_not_called()
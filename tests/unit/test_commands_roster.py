@@ -1,6 +1,12 @@
+import asyncio
+
 import pytest
 
-from groster.commands.roster import _get_roster_details
+from groster.commands.roster import (
+    _get_roster_details,
+    _save_character_files,
+    update_roster,
+)
 from groster.http_client import BlizzardAPIClient, BlizzardAPIError
 from groster.repository import InMemoryRosterRepository
 
@@ -141,3 +147,76 @@ async def test_get_roster_details_saves_raw_profiles_to_repo(mock_client, repo):
     key = repo._char_key(REGION, REALM, "A")
     assert key in repo._profiles
     assert repo._profiles[key]["equipped_item_level"] == 500
+
+
+# ---------------------------------------------------------------------------
+# _save_character_files
+# ---------------------------------------------------------------------------
+
+
+async def test_save_character_files_saves_every_character(repo):
+    files = {f"Char{i}": {"pets": [i]} for i in range(5)}
+
+    await _save_character_files(repo.save_character_pets, files, REGION, REALM)
+
+    for name, data in files.items():
+        assert repo._pets[repo._char_key(REGION, REALM, name)] == data
+
+
+async def test_save_character_files_caps_concurrent_saves(mocker):
+    mocker.patch("groster.commands.roster._SAVE_CONCURRENCY", 2)
+    in_flight = 0
+    peak = 0
+
+    async def save(data, region, realm, name):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    await _save_character_files(save, {f"c{i}": {} for i in range(6)}, REGION, REALM)
+
+    assert peak == 2
+
+
+# ---------------------------------------------------------------------------
+# update_roster
+# ---------------------------------------------------------------------------
+
+
+async def test_update_roster_failed_lookup_cancels_siblings_before_close(
+    mocker, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("BLIZZARD_CLIENT_ID", "id")
+    monkeypatch.setenv("BLIZZARD_CLIENT_SECRET", "secret")
+    mocker.patch("groster.commands.roster.resolve_data_path", return_value=tmp_path)
+    mocker.patch("groster.commands.roster.CsvRosterRepository")
+    cache = mocker.patch("groster.commands.roster.FileResponseCache").return_value
+    cache.prune = mocker.AsyncMock(return_value=0)
+    client = mocker.patch("groster.commands.roster.BlizzardAPIClient").return_value
+    events = []
+    client.close = mocker.AsyncMock(side_effect=lambda: events.append("close"))
+
+    async def failing_ranks(*_):
+        await asyncio.sleep(0)
+        raise RuntimeError("Failed to get guild ranks from default mapping")
+
+    async def pending_classes(*_):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            events.append("classes cancelled")
+            raise
+
+    mocker.patch("groster.commands.roster._get_guild_ranks", failing_ranks)
+    mocker.patch("groster.commands.roster._get_playable_classes", pending_classes)
+    mocker.patch(
+        "groster.commands.roster._get_playable_races",
+        mocker.AsyncMock(return_value={}),
+    )
+
+    with pytest.raises(RuntimeError, match="guild ranks"):
+        await update_roster(REGION, REALM, GUILD, "en_US")
+
+    assert events == ["classes cancelled", "close"]
@@ -0,0 +1,110 @@
+import os
+import time
+
+import pytest
+
+from groster.http_cache import CachedResponse, FileResponseCache, MemoryResponseCache
+
+KEY = "https://eu.api.blizzard.com/x?namespace=profile-eu&locale=en_US"
+
+# ---------------------------------------------------------------------------
+# MemoryResponseCache
+# ---------------------------------------------------------------------------
+
+
+async def test_memory_response_cache_set_then_get_returns_entry():
+    cache = MemoryResponseCache()
+    entry = CachedResponse('"abc"', None, {"pets": []})
+
+    await cache.set(KEY, entry)
+
+    assert await cache.get(KEY) == entry
+    assert await cache.get("other") is None
+
+
+async def test_memory_response_cache_full_evicts_least_recently_used():
+    cache = MemoryResponseCache(max_entries=2)
+    entry = CachedResponse('"abc"', None, {})
+
+    await cache.set("a", entry)
+    await cache.set("b", entry)
+    await cache.get("a")
+    await cache.set("c", entry)
+
+    assert await cache.get("a") == entry
+    assert await cache.get("b") is None
+    assert await cache.get("c") == entry
+
+
+def test_memory_response_cache_zero_max_entries_raises_value_error():
+    with pytest.raises(ValueError, match="max_entries"):
+        MemoryResponseCache(max_entries=0)
+
+
+# ---------------------------------------------------------------------------
+# FileResponseCache
+# ---------------------------------------------------------------------------
+
+
+async def test_file_response_cache_entry_survives_new_instance(tmp_path):
+    entry = CachedResponse('"abc"', "Wed, 21 Oct 2015 07:28:00 GMT", {"name": "Ärthas"})
+
+    await FileResponseCache(tmp_path).set(KEY, entry)
+    result = await FileResponseCache(tmp_path).get(KEY)
+
+    assert result == entry
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+async def test_file_response_cache_missing_key_returns_none(tmp_path):
+    assert await FileResponseCache(tmp_path).get(KEY) is None
+
+
+async def test_file_response_cache_corrupted_entry_returns_none(tmp_path):
+    cache = FileResponseCache(tmp_path)
+    await cache.set(KEY, CachedResponse('"abc"', None, {}))
+    for path in tmp_path.glob("*.json"):
+        path.write_text("not valid json")
+
+    assert await cache.get(KEY) is None
+
+
+def _age_entry(cache, key, seconds):
+    path = cache._entry_path(key)
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+async def test_file_response_cache_prune_removes_entries_older_than_max_age(
+    tmp_path,
+):
+    cache = FileResponseCache(tmp_path, max_age=60)
+    await cache.set("old", CachedResponse('"a"', None, {}))
+    await cache.set("new", CachedResponse('"b"', None, {}))
+    _age_entry(cache, "old", 120)
+
+    removed = await cache.prune()
+
+    assert removed == 1
+    assert await cache.get("old") is None
+    assert await cache.get("new") is not None
+
+
+async def test_file_response_cache_prune_keeps_most_recently_used(tmp_path):
+    cache = FileResponseCache(tmp_path, max_entries=2)
+    for index, key in enumerate(["a", "b", "c"]):
+        await cache.set(key, CachedResponse(None, None, {"key": key}))
+        _age_entry(cache, key, 30 - index * 10)
+    await cache.get("a")
+
+    removed = await cache.prune()
+
+    assert removed == 1
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert await cache.get("c") is not None
+
+
+def test_file_response_cache_zero_max_entries_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match="max_entries"):
+        FileResponseCache(tmp_path, max_entries=0)
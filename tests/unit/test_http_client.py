@@ -1,10 +1,19 @@
 import asyncio
 import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
 
 import httpx
 import pytest
 
-from groster.http_client import BlizzardAPIClient, BlizzardAPIError, _validate_region
+from groster.http_cache import CachedResponse, MemoryResponseCache
+from groster.http_client import (
+    BlizzardAPIClient,
+    BlizzardAPIError,
+    _CircuitBreaker,
+    _parse_retry_after,
+    _validate_region,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -32,6 +41,19 @@ def client(token_response, mocker):
     return c
 
 
+@pytest.fixture()
+def cached_client(token_response, mocker):
+    """Create a BlizzardAPIClient with an in-memory response cache."""
+    c = BlizzardAPIClient(
+        region="eu",
+        client_id="id",
+        client_secret="secret",
+        response_cache=MemoryResponseCache(),
+    )
+    mocker.patch.object(c.client, "post", return_value=token_response)
+    return c
+
+
 # ---------------------------------------------------------------------------
 # _validate_region
 # ---------------------------------------------------------------------------
@@ -47,6 +69,42 @@ def test_validate_region_unsupported_region_raises_value_error():
         _validate_region("xx")
 
 
+def test_validate_region_unsupported_region_lists_regions_sorted():
+    with pytest.raises(ValueError, match="Supported regions are: cn, eu, kr, tw, us$"):
+        _validate_region("xx")
+
+
+# ---------------------------------------------------------------------------
+# _parse_retry_after
+# ---------------------------------------------------------------------------
+
+
+def test_parse_retry_after_delay_seconds_returns_seconds():
+    assert _parse_retry_after("7") == 7.0
+
+
+def test_parse_retry_after_http_date_returns_seconds_until_date():
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+    delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert delay is not None
+    assert 28 <= delay <= 30
+
+
+def test_parse_retry_after_past_http_date_returns_zero():
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_parse_retry_after_long_delay_clamped_to_sixty_seconds():
+    assert _parse_retry_after("3600") == 60
+
+
+@pytest.mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_missing_or_malformed_returns_none(value):
+    assert _parse_retry_after(value) is None
+
+
 # ---------------------------------------------------------------------------
 # __init__
 # ---------------------------------------------------------------------------
@@ -60,6 +118,14 @@ def test_init_valid_params_creates_client():
     assert c.max_retries == 5
 
 
+def test_init_custom_timeout_applies_to_shared_client():
+    c = BlizzardAPIClient(
+        region="eu", client_id="id", client_secret="secret", timeout=7
+    )
+
+    assert c.client.timeout == httpx.Timeout(7)
+
+
 def test_init_missing_params_raises_value_error():
     with pytest.raises(ValueError, match="Region, client ID, and client secret"):
         BlizzardAPIClient(region="", client_id="id", client_secret="secret")
@@ -99,6 +165,33 @@ def test_format_url_strips_leading_slash():
     assert result == "https://us.api.blizzard.com/path"
 
 
+# ---------------------------------------------------------------------------
+# _character_url
+# ---------------------------------------------------------------------------
+
+
+def test_character_url_cn_region_lowercases_name_once():
+    c = BlizzardAPIClient(region="cn", client_id="id", client_secret="secret")
+
+    result = c._character_url("terokkar", "ÄrThas", "/collections/pets")
+
+    assert result == (
+        "https://gateway.battlenet.com.cn/profile/wow/character/"
+        "terokkar/ärthas/collections/pets?namespace=profile-cn&locale=en_US"
+    )
+
+
+def test_get_guild_roster_url_carries_profile_query(client, mocker):
+    mocker.patch.object(client, "_request", return_value={})
+
+    asyncio.run(client.get_guild_roster("terokkar", "darq-side"))
+
+    assert client._request.call_args.args[1] == (
+        "https://eu.api.blizzard.com/data/wow/guild/terokkar/darq-side/roster"
+        "?namespace=profile-eu&locale=en_US"
+    )
+
+
 # ---------------------------------------------------------------------------
 # _get_access_token
 # ---------------------------------------------------------------------------
@@ -112,6 +205,12 @@ def test_get_access_token_fetches_new_token(client):
     assert client._token_expires_at > time.time()
 
 
+def test_get_access_token_sets_authorization_on_shared_client(client):
+    asyncio.run(client._get_access_token())
+
+    assert client.client.headers["Authorization"] == "Bearer test-token-abc"
+
+
 def test_get_access_token_reuses_cached_token(client, mocker):
     client._api_token = "cached-token"
     client._token_expires_at = time.time() + 9999
@@ -131,6 +230,22 @@ def test_get_access_token_refreshes_expired_token(client):
     assert token == "test-token-abc"
 
 
+def test_get_access_token_concurrent_expired_callers_renew_once(client, token_response):
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0)
+        return token_response
+
+    client.client.post.side_effect = slow_post
+
+    async def run():
+        return await asyncio.gather(*(client._get_access_token() for _ in range(5)))
+
+    tokens = asyncio.run(run())
+
+    assert tokens == ["test-token-abc"] * 5
+    client.client.post.assert_called_once()
+
+
 def test_get_access_token_missing_token_in_response_raises(client):
     client.client.post.return_value = httpx.Response(
         200,
@@ -171,6 +286,89 @@ def test_request_success_returns_json(client, mocker):
     assert result == {"data": "ok"}
 
 
+# ---------------------------------------------------------------------------
+# _request — conditional GET
+# ---------------------------------------------------------------------------
+
+
+def test_request_not_modified_returns_cached_payload(cached_client, mocker):
+    req = httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    first = httpx.Response(
+        200, json={"pets": [1, 2]}, headers={"ETag": '"abc"'}, request=req
+    )
+    not_modified = httpx.Response(304, request=req)
+    request_mock = mocker.patch.object(
+        cached_client.client, "request", side_effect=[first, not_modified]
+    )
+
+    asyncio.run(cached_client._request("GET", "https://eu.api.blizzard.com/x"))
+    result = asyncio.run(cached_client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert result == {"pets": [1, 2]}
+    assert request_mock.call_args_list[0].kwargs["headers"] is None
+    assert request_mock.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_request_last_modified_sends_if_modified_since(cached_client, mocker):
+    req = httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    first = httpx.Response(
+        200, json={"ok": True}, headers={"Last-Modified": last_modified}, request=req
+    )
+    not_modified = httpx.Response(304, request=req)
+    request_mock = mocker.patch.object(
+        cached_client.client, "request", side_effect=[first, not_modified]
+    )
+
+    asyncio.run(cached_client._request("GET", "https://eu.api.blizzard.com/x"))
+    result = asyncio.run(cached_client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert result == {"ok": True}
+    headers = request_mock.call_args_list[1].kwargs["headers"]
+    assert headers == {"If-Modified-Since": last_modified}
+
+
+def test_request_without_response_cache_sends_no_validators(client, mocker):
+    req = httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    response = httpx.Response(200, json={}, headers={"ETag": '"abc"'}, request=req)
+    request_mock = mocker.patch.object(client.client, "request", return_value=response)
+
+    asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+    asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert request_mock.call_args_list[1].kwargs["headers"] is None
+
+
+def test_request_uses_injected_response_cache(token_response, mocker):
+    cache = MemoryResponseCache()
+    url = "https://eu.api.blizzard.com/x"
+    asyncio.run(cache.set(url, CachedResponse('"abc"', None, {"cached": True})))
+    c = BlizzardAPIClient(
+        region="eu", client_id="id", client_secret="secret", response_cache=cache
+    )
+    mocker.patch.object(c.client, "post", return_value=token_response)
+    not_modified = httpx.Response(304, request=httpx.Request("GET", url))
+    mocker.patch.object(c.client, "request", return_value=not_modified)
+
+    result = asyncio.run(c._request("GET", url))
+
+    assert result == {"cached": True}
+
+
+def test_request_etag_cache_keyed_by_query_params(cached_client, mocker):
+    req = httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    response = httpx.Response(200, json={}, headers={"ETag": '"abc"'}, request=req)
+    request_mock = mocker.patch.object(
+        cached_client.client, "request", return_value=response
+    )
+    url = "https://eu.api.blizzard.com/x"
+
+    asyncio.run(cached_client._request("GET", url, params={"namespace": "profile-eu"}))
+    asyncio.run(cached_client._request("GET", url, params={"namespace": "static-eu"}))
+
+    assert request_mock.call_args_list[1].kwargs["headers"] is None
+
+
 # ---------------------------------------------------------------------------
 # _request — retry on transient errors
 # ---------------------------------------------------------------------------
@@ -227,10 +425,56 @@ def test_request_retry_after_header_integer_used_as_delay(client, mocker):
     )
     mocker.patch.object(client.client, "request", side_effect=[rate_limited, success])
     sleep_mock = mocker.patch("groster.http_client.asyncio.sleep", return_value=None)
+    mocker.patch("groster.http_client.random.uniform", return_value=0.25)
+
+    asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    sleep_mock.assert_any_call(7.25)
+
+
+def test_request_retry_after_http_date_used_as_delay(client, mocker):
+    retry_at = datetime.now(UTC) + timedelta(seconds=10)
+    rate_limited = httpx.Response(
+        429,
+        headers={"Retry-After": format_datetime(retry_at, usegmt=True)},
+        request=httpx.Request("GET", "https://eu.api.blizzard.com/x"),
+    )
+    success = httpx.Response(
+        200,
+        json={"ok": True},
+        request=httpx.Request("GET", "https://eu.api.blizzard.com/x"),
+    )
+    mocker.patch.object(client.client, "request", side_effect=[rate_limited, success])
+    sleep_mock = mocker.patch("groster.http_client.asyncio.sleep", return_value=None)
+    mocker.patch("groster.http_client.random.uniform", return_value=0.0)
 
     asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
 
-    sleep_mock.assert_any_call(7)
+    delay = sleep_mock.call_args.args[0]
+    assert 8 <= delay <= 10
+
+
+def test_request_transient_error_without_retry_after_sleeps_jittered_backoff(
+    client, mocker
+):
+    client.max_retries = 4
+    error_resp = httpx.Response(
+        503,
+        request=httpx.Request("GET", "https://eu.api.blizzard.com/x"),
+    )
+    mocker.patch.object(client.client, "request", return_value=error_resp)
+    mocker.patch("groster.http_client.asyncio.sleep", return_value=None)
+    uniform = mocker.patch("groster.http_client.random.uniform", return_value=0.1)
+
+    with pytest.raises(BlizzardAPIError):
+        asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert [c.args for c in uniform.call_args_list] == [
+        (0, 0.5),
+        (0, 1.0),
+        (0, 2.0),
+        (0, 4.0),
+    ]
 
 
 def test_request_max_retries_exceeded_raises_blizzard_api_error(client, mocker):
@@ -312,6 +556,100 @@ def test_request_not_found_raises_blizzard_api_error(client, mocker):
     assert client.client.request.call_count == 1
 
 
+def test_request_repeated_failures_skip_further_requests(client, mocker):
+    client.max_retries = 1
+    client._circuit = _CircuitBreaker(threshold=2, open_seconds=30)
+    req = httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    mocker.patch.object(
+        client.client,
+        "request",
+        side_effect=httpx.ConnectError("connection refused", request=req),
+    )
+    mocker.patch("groster.http_client.asyncio.sleep", return_value=None)
+
+    for _ in range(2):
+        with pytest.raises(BlizzardAPIError, match="failed after 1 retries"):
+            asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+    with pytest.raises(BlizzardAPIError, match="unavailable") as exc_info:
+        asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert exc_info.value.status_code == 503
+    assert client.client.request.call_count == 2
+
+
+def test_request_not_found_does_not_count_as_failure(client, mocker):
+    client._circuit = _CircuitBreaker(threshold=1, open_seconds=30)
+    resp_404 = httpx.Response(
+        404, request=httpx.Request("GET", "https://eu.api.blizzard.com/x")
+    )
+    mocker.patch.object(client.client, "request", return_value=resp_404)
+
+    for _ in range(2):
+        with pytest.raises(BlizzardAPIError, match="failed with status 404"):
+            asyncio.run(client._request("GET", "https://eu.api.blizzard.com/x"))
+
+    assert client.client.request.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# _CircuitBreaker
+# ---------------------------------------------------------------------------
+
+
+def test_circuit_breaker_below_threshold_allows_requests():
+    circuit = _CircuitBreaker(threshold=3, open_seconds=30)
+
+    circuit.record_failure()
+    circuit.record_failure()
+
+    assert circuit.allow()
+
+
+def test_circuit_breaker_success_resets_failure_count():
+    circuit = _CircuitBreaker(threshold=2, open_seconds=30)
+
+    circuit.record_failure()
+    circuit.record_success()
+    circuit.record_failure()
+
+    assert circuit.allow()
+
+
+def test_circuit_breaker_after_open_period_allows_single_probe(mocker):
+    now = mocker.patch("groster.http_client.time.monotonic", return_value=100.0)
+    circuit = _CircuitBreaker(threshold=1, open_seconds=30)
+    circuit.record_failure()
+
+    now.return_value = 131.0
+
+    assert [circuit.allow(), circuit.allow()] == [True, False]
+
+
+def test_circuit_breaker_successful_probe_closes_circuit(mocker):
+    now = mocker.patch("groster.http_client.time.monotonic", return_value=100.0)
+    circuit = _CircuitBreaker(threshold=1, open_seconds=30)
+    circuit.record_failure()
+    now.return_value = 131.0
+    circuit.allow()
+
+    circuit.record_success()
+
+    assert circuit.allow()
+
+
+def test_circuit_breaker_failed_probe_reopens_circuit(mocker):
+    now = mocker.patch("groster.http_client.time.monotonic", return_value=100.0)
+    circuit = _CircuitBreaker(threshold=1, open_seconds=30)
+    circuit.record_failure()
+    now.return_value = 131.0
+    circuit.allow()
+
+    circuit.record_failure()
+    now.return_value = 160.0
+
+    assert not circuit.allow()
+
+
 # ---------------------------------------------------------------------------
 # Public API methods
 # ---------------------------------------------------------------------------
@@ -395,6 +733,35 @@ def test_get_playable_classes_empty_response_returns_empty_list(client, mocker):
     assert result == []
 
 
+def test_get_playable_classes_repeated_call_reuses_static_data(client, mocker):
+    request = mocker.patch.object(
+        client,
+        "_request",
+        return_value={"classes": [{"id": 1, "name": "Warrior"}]},
+    )
+
+    asyncio.run(client.get_playable_classes())
+    result = asyncio.run(client.get_playable_classes())
+
+    assert result == [{"id": 1, "name": "Warrior"}]
+    request.assert_called_once()
+
+
+def test_get_playable_classes_expired_static_data_is_refetched(client, mocker):
+    request = mocker.patch.object(
+        client,
+        "_request",
+        return_value={"classes": [{"id": 1, "name": "Warrior"}]},
+    )
+    monotonic = mocker.patch("groster.http_client.time.monotonic", return_value=0.0)
+
+    asyncio.run(client.get_playable_classes())
+    monotonic.return_value = 24 * 60 * 60 + 1
+    asyncio.run(client.get_playable_classes())
+
+    assert request.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Context manager
 # ---------------------------------------------------------------------------
@@ -0,0 +1,191 @@
+import logging
+import queue
+
+import pytest
+
+from groster import logging as groster_logging
+from groster.logging import (
+    _BufferedFileHandler,
+    _FlushingQueueListener,
+    _queue_handlers,
+    setup_logging,
+)
+
+
+class _CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    test_logger = logging.getLogger(name)
+    test_logger.propagate = False
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.addHandler(handler)
+    return test_logger
+
+
+def test_queue_handlers_forwards_records_to_target_handlers():
+    target = _CollectingHandler()
+    queue_handler, listener = _queue_handlers([target])
+    test_logger = _make_logger("groster.tests.queue_forward", queue_handler)
+
+    listener.start()
+    try:
+        test_logger.info("Fetched %d members", 3)
+    finally:
+        listener.stop()
+        test_logger.removeHandler(queue_handler)
+
+    assert [r.getMessage() for r in target.records] == ["Fetched 3 members"]
+
+
+def test_queue_handlers_args_merged_before_enqueue():
+    target = _CollectingHandler()
+    queue_handler, listener = _queue_handlers([target])
+    test_logger = _make_logger("groster.tests.queue_args", queue_handler)
+    names = ["Alice"]
+
+    test_logger.info("Names: %s", names)
+    names.append("Bob")
+    listener.start()
+    listener.stop()
+    test_logger.removeHandler(queue_handler)
+
+    assert target.records[0].getMessage() == "Names: ['Alice']"
+
+
+def test_queue_handlers_exception_info_kept_for_formatters():
+    target = _CollectingHandler()
+    queue_handler, listener = _queue_handlers([target])
+    test_logger = _make_logger("groster.tests.queue_exc", queue_handler)
+
+    listener.start()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            test_logger.exception("Request failed")
+    finally:
+        listener.stop()
+        test_logger.removeHandler(queue_handler)
+
+    record = target.records[0]
+    assert record.getMessage() == "Request failed"
+    assert record.exc_info is not None
+    assert record.exc_info[0] is ValueError
+
+
+def _make_record(level: int, msg: str, created: float) -> logging.LogRecord:
+    record = logging.LogRecord("groster.tests", level, __file__, 1, msg, None, None)
+    record.created = created
+    return record
+
+
+def test_buffered_file_handler_info_records_held_until_flush():
+    target = _CollectingHandler()
+    handler = _BufferedFileHandler(target)
+
+    handler.handle(_make_record(logging.INFO, "first", 100.0))
+    handler.handle(_make_record(logging.INFO, "second", 100.5))
+    held = len(target.records)
+    handler.close()
+
+    assert held == 0
+    assert [r.getMessage() for r in target.records] == ["first", "second"]
+
+
+def test_buffered_file_handler_error_record_flushes_buffer():
+    target = _CollectingHandler()
+    handler = _BufferedFileHandler(target)
+
+    handler.handle(_make_record(logging.INFO, "first", 100.0))
+    handler.handle(_make_record(logging.ERROR, "failed", 100.1))
+
+    assert [r.getMessage() for r in target.records] == ["first", "failed"]
+
+
+def test_buffered_file_handler_old_buffer_flushed_on_next_record():
+    target = _CollectingHandler()
+    handler = _BufferedFileHandler(target)
+
+    handler.handle(_make_record(logging.INFO, "first", 100.0))
+    handler.handle(_make_record(logging.INFO, "later", 101.0))
+    handler.handle(_make_record(logging.INFO, "next", 101.2))
+
+    assert [r.getMessage() for r in target.records] == ["first", "later"]
+
+
+class _EmptyOnceQueue:
+    """Queue whose first get() times out, then returns the given record."""
+
+    def __init__(self, record: logging.LogRecord) -> None:
+        self.record = record
+        self.timed_out = False
+
+    def get(self, block: bool, timeout: float | None = None) -> logging.LogRecord:
+        if not self.timed_out:
+            self.timed_out = True
+            raise queue.Empty
+        return self.record
+
+
+def test_flushing_queue_listener_idle_queue_flushes_buffered_records():
+    target = _CollectingHandler()
+    handler = _BufferedFileHandler(target)
+    handler.handle(_make_record(logging.INFO, "buffered", 100.0))
+    next_record = _make_record(logging.INFO, "next", 200.0)
+    listener = _FlushingQueueListener(_EmptyOnceQueue(next_record), handler)
+
+    result = listener.dequeue(True)
+
+    assert result is next_record
+    assert [r.getMessage() for r in target.records] == ["buffered"]
+
+
+@pytest.fixture
+def json_logging(monkeypatch):
+    monkeypatch.setenv("GROSTER_LOG_FORMAT", "json")
+    yield
+    groster_logging._stop_active_listener()
+
+
+def _clear_root_handlers(monkeypatch) -> logging.Logger:
+    # pytest attaches its capture handlers for the test call, and basicConfig
+    # only installs handlers on a root logger that has none
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    return root
+
+
+def test_setup_logging_repeated_call_replaces_previous_listener(
+    json_logging, monkeypatch
+):
+    root = _clear_root_handlers(monkeypatch)
+    setup_logging()
+    _, first_listener = groster_logging._active[0]
+
+    setup_logging()
+    second_handler, second_listener = groster_logging._active[0]
+
+    assert root.handlers == [second_handler]
+    assert len(groster_logging._active) == 1
+    assert first_listener._thread is None
+    assert second_listener._thread is not None
+
+
+def test_setup_logging_repeated_call_keeps_earlier_records(json_logging, monkeypatch):
+    _clear_root_handlers(monkeypatch)
+    setup_logging()
+    target = _CollectingHandler()
+    groster_logging._active[0][1].handlers = (target,)
+    logging.getLogger("groster.tests.setup").info("before reconfigure")
+
+    setup_logging()
+
+    assert [r.getMessage() for r in target.records] == ["before reconfigure"]
@@ -1,4 +1,8 @@
 import json
+import logging
+import os
+import shutil
+from pathlib import Path
 
 import pandas as pd
 import pytest
@@ -15,6 +19,102 @@ def csv_repo(tmp_path):
     return CsvRosterRepository(base_path=tmp_path)
 
 
+# ---------------------------------------------------------------------------
+# __init__
+# ---------------------------------------------------------------------------
+
+
+def test_init_relative_base_path_resolves_to_absolute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    repo = CsvRosterRepository(base_path=Path("data"))
+
+    assert repo.base_path == (tmp_path / "data").resolve()
+    assert repo.base_path.is_dir()
+
+
+# ---------------------------------------------------------------------------
+# save_playable_classes / save_playable_races / save_guild_ranks
+# ---------------------------------------------------------------------------
+
+
+async def test_save_playable_classes_writes_header_and_rows(csv_repo, tmp_path):
+    from groster.utils import data_path
+
+    await csv_repo.save_playable_classes(
+        [{"id": 1, "name": "Warrior"}, {"id": 2, "name": "Paladin"}]
+    )
+
+    content = data_path(tmp_path, "classes").read_text(encoding="utf-8")
+    assert content == "id,name\n1,Warrior\n2,Paladin\n"
+
+
+async def test_save_guild_ranks_quotes_names_with_commas(csv_repo, tmp_path):
+    from groster.utils import data_path
+
+    await csv_repo.save_guild_ranks(
+        [{"id": 0, "name": "Master, Grand"}], REGION, REALM, GUILD
+    )
+
+    ranks_file = data_path(tmp_path, REGION, REALM, GUILD, "ranks")
+    assert ranks_file.read_text(encoding="utf-8") == 'id,name\n0,"Master, Grand"\n'
+
+
+async def test_get_playable_classes_save_then_get_round_trips_mapping(csv_repo):
+    await csv_repo.save_playable_classes(
+        [{"id": 1, "name": "Warrior"}, {"id": 6, "name": "Death Knight"}]
+    )
+
+    result = await csv_repo.get_playable_classes()
+
+    assert result == {1: "Warrior", 6: "Death Knight"}
+
+
+async def test_get_playable_races_empty_file_returns_none(csv_repo, tmp_path):
+    from groster.utils import data_path
+
+    data_path(tmp_path, "races").write_text("", encoding="utf-8")
+
+    result = await csv_repo.get_playable_races()
+
+    assert result is None
+
+
+async def test_get_guild_ranks_malformed_file_returns_none(csv_repo, tmp_path):
+    from groster.utils import data_path
+
+    ranks_file = data_path(tmp_path, REGION, REALM, GUILD, "ranks")
+    ranks_file.write_text("id,name\nnot-a-number,Officer\n", encoding="utf-8")
+
+    result = await csv_repo.get_guild_ranks(REGION, REALM, GUILD)
+
+    assert result is None
+
+
+async def test_get_playable_classes_unchanged_file_reads_once(csv_repo, mocker):
+    import groster.repository.csv as csv_module
+
+    await csv_repo.save_playable_classes([{"id": 1, "name": "Warrior"}])
+    read_spy = mocker.spy(csv_module, "_read_id_name_map")
+
+    first = await csv_repo.get_playable_classes()
+    second = await csv_repo.get_playable_classes()
+
+    assert first == second == {1: "Warrior"}
+    assert read_spy.call_count == 1
+
+
+async def test_get_playable_classes_rewritten_file_is_reread(csv_repo):
+    await csv_repo.save_playable_classes([{"id": 1, "name": "Warrior"}])
+    await csv_repo.get_playable_classes()
+
+    await csv_repo.save_playable_classes(
+        [{"id": 1, "name": "Warrior"}, {"id": 2, "name": "Paladin"}]
+    )
+
+    assert await csv_repo.get_playable_classes() == {1: "Warrior", 2: "Paladin"}
+
+
 # ---------------------------------------------------------------------------
 # get_roster_details
 # ---------------------------------------------------------------------------
@@ -133,6 +233,39 @@ async def test_save_character_achievements_creates_json_file(csv_repo, tmp_path)
     assert saved["fingerprint"] == [[9670, 100]]
 
 
+async def test_save_character_pets_non_ascii_name_round_trips(csv_repo, tmp_path):
+    pets_data = {"pets": [{"species": {"name": "Ébène"}}]}
+
+    await csv_repo.save_character_pets(pets_data, REGION, REALM, "Ärthas")
+
+    pets_file = tmp_path / REGION / REALM / "ärthas" / "pets.json"
+    assert "Ébène" in pets_file.read_text(encoding="utf-8")
+    assert json.loads(pets_file.read_text(encoding="utf-8")) == pets_data
+
+
+async def test_save_character_files_same_character_skips_repeated_mkdir(
+    csv_repo, mocker
+):
+    await csv_repo.save_character_profile({}, REGION, REALM, "Varian")
+    mkdir_spy = mocker.spy(type(csv_repo.base_path), "mkdir")
+
+    await csv_repo.save_character_pets({}, REGION, REALM, "Varian")
+    await csv_repo.save_character_mounts({}, REGION, REALM, "Varian")
+
+    mkdir_spy.assert_not_called()
+    assert (csv_repo.base_path / REGION / REALM / "varian" / "mounts.json").exists()
+
+
+async def test_save_character_files_removed_directory_recreates_it(csv_repo):
+    await csv_repo.save_character_profile({}, REGION, REALM, "Varian")
+    char_path = csv_repo.base_path / REGION / REALM / "varian"
+    shutil.rmtree(csv_repo.base_path / REGION)
+
+    await csv_repo.save_character_pets({"pets": []}, REGION, REALM, "Varian")
+
+    assert json.loads((char_path / "pets.json").read_text()) == {"pets": []}
+
+
 async def test_get_member_fingerprints_multiple_names_returns_found_only(csv_repo):
     for name, char_id in [("Alpha", 1), ("Beta", 2)]:
         await csv_repo.save_character_achievements(
@@ -204,3 +337,190 @@ async def test_save_achievements_summary_defaults_fingerprint_source_to_api(csv_
     csv_path = data_path(csv_repo.base_path, REGION, REALM, GUILD, "achievements")
     df = pd.read_csv(csv_path)
     assert df.loc[0, "fingerprint_source"] == "api"
+
+
+# ---------------------------------------------------------------------------
+# save_alts_data
+# ---------------------------------------------------------------------------
+
+
+async def test_save_alts_data_writes_columns_and_booleans(csv_repo):
+    alts_data = [
+        {"id": 1, "name": "Main", "alt": False, "main": "Main"},
+        {"id": 2, "name": "Alt", "alt": True, "main": "Main"},
+        {"id": 3, "name": "Solo", "alt": False, "main": "Solo"},
+    ]
+
+    await csv_repo.save_alts_data(alts_data, REGION, REALM, GUILD)
+
+    df = pd.read_csv(csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-alts.csv")
+    assert list(df.columns) == ["id", "name", "alt", "main"]
+    assert df["alt"].tolist() == [False, True, False]
+
+
+# ---------------------------------------------------------------------------
+# build_dashboard
+# ---------------------------------------------------------------------------
+
+
+async def _save_dashboard_sources(csv_repo):
+    await csv_repo.save_playable_classes([{"id": 1, "name": "Warrior"}])
+    await csv_repo.save_playable_races([{"id": 1, "name": "Human"}])
+    await csv_repo.save_guild_ranks([{"id": 0, "name": "GM"}], REGION, REALM, GUILD)
+    await csv_repo.save_roster_details(
+        [
+            {
+                "id": i,
+                "name": name,
+                "realm": REALM,
+                "level": 80,
+                "class_id": i,
+                "race_id": 1,
+                "rank": 0,
+                "ilvl": 600,
+                "last_login": "2026-01-01",
+            }
+            for i, name in ((1, "Alice"), (2, "Bob"), (3, "Carol"))
+        ],
+        REGION,
+        REALM,
+        GUILD,
+    )
+    await csv_repo.save_profile_links(
+        [
+            {
+                "id": i,
+                "name": name,
+                "rio_link": f"rio/{name}",
+                "armory_link": f"armory/{name}",
+                "warcraft_logs_link": f"logs/{name}",
+            }
+            for i, name in ((1, "Alice"), (2, "Bob"))
+        ],
+        REGION,
+        REALM,
+        GUILD,
+    )
+    await csv_repo.save_alts_data(
+        [
+            {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
+            {"id": 2, "name": "Bob", "alt": True, "main": "Alice"},
+            {"id": 3, "name": "Carol", "alt": False, "main": "Carol"},
+        ],
+        REGION,
+        REALM,
+        GUILD,
+    )
+    await csv_repo.save_achievements_summary(
+        [{"id": 1, "name": "Alice", "total_quantity": 10, "total_points": 50}],
+        REGION,
+        REALM,
+        GUILD,
+    )
+
+
+async def test_build_dashboard_joins_per_character_files_on_id_and_name(csv_repo):
+    await _save_dashboard_sources(csv_repo)
+
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    df = pd.read_csv(csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-dashboard.csv")
+    assert df["Name"].tolist() == ["Alice", "Bob"]
+    assert df["Main"].tolist() == ["Alice", "Alice"]
+    assert df["Raider.io"].tolist() == ["rio/Alice", "rio/Bob"]
+    assert df.loc[0, "AQ"] == 10
+    assert pd.isna(df.loc[1, "AQ"])
+    assert df.loc[0, "Class"] == "Warrior"
+    assert pd.isna(df.loc[1, "Class"])
+    assert df["Rank"].tolist() == ["GM", "GM"]
+
+
+async def test_build_dashboard_writes_columns_in_dashboard_order(csv_repo):
+    await _save_dashboard_sources(csv_repo)
+
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    df = pd.read_csv(csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-dashboard.csv")
+    assert df.columns.tolist() == [
+        "Name",
+        "Realm",
+        "Level",
+        "Class",
+        "Race",
+        "Rank",
+        "AQ",
+        "AP",
+        "Alt?",
+        "Main",
+        "iLvl",
+        "Last Login",
+        "Raider.io",
+        "Armory",
+        "Logs",
+    ]
+
+
+async def test_build_dashboard_missing_source_file_raises_runtime_error(csv_repo):
+    await csv_repo.save_roster_details(
+        [{"id": 1, "name": "Alice"}], REGION, REALM, GUILD
+    )
+
+    with pytest.raises(RuntimeError, match="source CSV file is missing"):
+        await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+
+async def test_build_dashboard_duplicate_character_rows_keeps_last(csv_repo, caplog):
+    await _save_dashboard_sources(csv_repo)
+    await csv_repo.save_achievements_summary(
+        [
+            {"id": 1, "name": "Alice", "total_quantity": 10, "total_points": 50},
+            {"id": 1, "name": "Alice", "total_quantity": 12, "total_points": 60},
+        ],
+        REGION,
+        REALM,
+        GUILD,
+    )
+
+    with caplog.at_level(logging.WARNING, logger="groster.repository.csv"):
+        await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    dashboard = pd.read_csv(
+        csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-dashboard.csv"
+    )
+    alice = dashboard[dashboard["Name"] == "Alice"]
+    assert len(alice) == 1
+    assert alice.iloc[0]["AP"] == 60
+    assert "(1, 'Alice')" in caplog.text
+
+
+async def test_build_dashboard_unchanged_sources_skips_rebuild(csv_repo, mocker):
+    await _save_dashboard_sources(csv_repo)
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+    dashboard_file = csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-dashboard.csv"
+    os.utime(dashboard_file, (0, 0))
+    read_csv_spy = mocker.spy(pd, "read_csv")
+
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    read_csv_spy.assert_not_called()
+    assert dashboard_file.stat().st_mtime > 0
+
+
+async def test_build_dashboard_changed_source_rebuilds(csv_repo):
+    await _save_dashboard_sources(csv_repo)
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    await csv_repo.save_alts_data(
+        [
+            {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
+            {"id": 2, "name": "Bob", "alt": False, "main": "Bob"},
+            {"id": 3, "name": "Carol", "alt": False, "main": "Carol"},
+        ],
+        REGION,
+        REALM,
+        GUILD,
+    )
+    await csv_repo.build_dashboard(REGION, REALM, GUILD)
+
+    df = pd.read_csv(csv_repo.base_path / f"{REGION}-{REALM}-{GUILD}-dashboard.csv")
+    assert df["Main"].tolist() == ["Alice", "Bob"]
@@ -231,83 +231,61 @@ async def test_build_dashboard_missing_achievements_uses_empty_values(
     assert dashboard[0]["AP"] is None
 
 
-# ── get_alt_summary ──────────────────────────────────────────────────────────
+# ── summary_report ───────────────────────────────────────────────────────────
 
 
-async def test_get_alt_summary_with_alts_returns_correct_counts(
-    seeded_repo: InMemoryRosterRepository,
+def test_summary_report_with_data_logs_alt_and_main_counts(
+    caplog: pytest.LogCaptureFixture,
 ):
-    result = await seeded_repo.get_alt_summary(REGION, REALM, GUILD)
-
-    assert result == (1, 1)
-
+    alts_data = [
+        {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
+        {"id": 2, "name": "Bob", "alt": True, "main": "Alice"},
+    ]
 
-async def test_get_alt_summary_no_data_returns_none(
-    in_memory_repo: InMemoryRosterRepository,
-):
-    result = await in_memory_repo.get_alt_summary(REGION, REALM, GUILD)
+    with caplog.at_level(logging.INFO):
+        summary_report(alts_data, 1.23)
 
-    assert result is None
+    assert "Processing completed in 1.23 seconds" in caplog.text
+    assert "Alts found: 1" in caplog.text
+    assert "Main characters: 1" in caplog.text
 
 
-async def test_get_alt_summary_no_alts_detected_returns_zero_alts(
-    in_memory_repo: InMemoryRosterRepository,
+def test_summary_report_no_alts_detected_logs_zero_alts(
+    caplog: pytest.LogCaptureFixture,
 ):
-    await in_memory_repo.save_alts_data(
-        [
-            {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
-            {"id": 2, "name": "Bob", "alt": False, "main": "Bob"},
-            {"id": 3, "name": "Charlie", "alt": False, "main": "Charlie"},
-        ],
-        REGION,
-        REALM,
-        GUILD,
-    )
+    alts_data = [
+        {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
+        {"id": 2, "name": "Bob", "alt": False, "main": "Bob"},
+        {"id": 3, "name": "Charlie", "alt": False, "main": "Charlie"},
+    ]
 
-    result = await in_memory_repo.get_alt_summary(REGION, REALM, GUILD)
+    with caplog.at_level(logging.INFO):
+        summary_report(alts_data, 1.0)
 
-    assert result == (0, 3)
+    assert "Alts found: 0" in caplog.text
+    assert "Main characters: 3" in caplog.text
 
 
-async def test_get_alt_summary_multiple_mains_returns_distinct_count(
-    in_memory_repo: InMemoryRosterRepository,
+def test_summary_report_multiple_mains_logs_distinct_count(
+    caplog: pytest.LogCaptureFixture,
 ):
-    await in_memory_repo.save_alts_data(
-        [
-            {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
-            {"id": 2, "name": "Bob", "alt": True, "main": "Alice"},
-            {"id": 3, "name": "Charlie", "alt": False, "main": "Charlie"},
-            {"id": 4, "name": "Dave", "alt": True, "main": "Charlie"},
-        ],
-        REGION,
-        REALM,
-        GUILD,
-    )
-
-    result = await in_memory_repo.get_alt_summary(REGION, REALM, GUILD)
-
-    assert result == (2, 2)
-
-
-# ── summary_report ───────────────────────────────────────────────────────────
-
+    alts_data = [
+        {"id": 1, "name": "Alice", "alt": False, "main": "Alice"},
+        {"id": 2, "name": "Bob", "alt": True, "main": "Alice"},
+        {"id": 3, "name": "Charlie", "alt": False, "main": "Charlie"},
+        {"id": 4, "name": "Dave", "alt": True, "main": "Charlie"},
+    ]
 
-async def test_summary_report_with_data_logs_alt_and_main_counts(
-    seeded_repo: InMemoryRosterRepository, caplog: pytest.LogCaptureFixture
-):
     with caplog.at_level(logging.INFO):
-        await summary_report(seeded_repo, REGION, REALM, GUILD, 1.23)
+        summary_report(alts_data, 1.0)
 
-    assert "Processing completed in 1.23 seconds" in caplog.text
-    assert "Alts found: 1" in caplog.text
-    assert "Main characters: 1" in caplog.text
+    assert "Alts found: 2" in caplog.text
+    assert "Main characters: 2" in caplog.text
 
 
-async def test_summary_report_no_data_logs_time_only(
-    in_memory_repo: InMemoryRosterRepository, caplog: pytest.LogCaptureFixture
-):
+def test_summary_report_no_data_logs_time_only(caplog: pytest.LogCaptureFixture):
     with caplog.at_level(logging.INFO):
-        await summary_report(in_memory_repo, REGION, REALM, GUILD, 5.67)
+        summary_report([], 5.67)
 
     assert "Processing completed in 5.67 seconds" in caplog.text
     assert "Alts found" not in caplog.text
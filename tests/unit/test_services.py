@@ -2,7 +2,11 @@ import asyncio
 
 import pytest
 
-from groster.constants import LEVEL_10_ACHIEVEMENT_ID, MAIN_SCORE_WEIGHTS
+from groster.constants import (
+    FINGERPRINT_ACHIEVEMENT_IDS,
+    LEVEL_10_ACHIEVEMENT_ID,
+    MAIN_SCORE_WEIGHTS,
+)
 from groster.http_client import BlizzardAPIClient, BlizzardAPIError
 from groster.services import (
     _apply_hidden_profile_fallback,
@@ -10,7 +14,8 @@ from groster.services import (
     _build_fingerprint_cache,
     _classify_fetch_results,
     _find_main_in_group,
-    _score_main_candidate,
+    _gather_rate_limited,
+    _score_raw_factors,
     assign_main_characters,
     build_profile_links,
     cluster_characters_by_fingerprint,
@@ -95,6 +100,57 @@ def test_armory_locale_unknown_region_returns_default():
     assert result == "en-us"
 
 
+# ---------------------------------------------------------------------------
+# _gather_rate_limited
+# ---------------------------------------------------------------------------
+
+
+def test_gather_rate_limited_returns_results_in_input_order():
+    async def delayed(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    async def run():
+        return await _gather_rate_limited(
+            [delayed("a", 0.03), delayed("b", 0.0), delayed("c", 0.01)]
+        )
+
+    assert asyncio.run(run()) == ["a", "b", "c"]
+
+
+def test_gather_rate_limited_holds_slot_for_one_second():
+    started_at = []
+    hold_delays = []
+    now = [100.0]
+
+    async def record():
+        started_at.append(asyncio.get_running_loop().time())
+
+    async def run():
+        loop = asyncio.get_running_loop()
+
+        # Fake clock: a delayed release fires on the next loop iteration and
+        # moves the clock forward to its due time instead of sleeping
+        def call_later(delay, callback):
+            due = now[0] + delay
+            hold_delays.append(delay)
+
+            def fire():
+                now[0] = max(now[0], due)
+                callback()
+
+            return loop.call_soon(fire)
+
+        loop.time = lambda: now[0]
+        loop.call_later = call_later
+        await _gather_rate_limited([record(), record(), record()], limit=2)
+
+    asyncio.run(run())
+
+    assert started_at == [100.0, 100.0, 101.0]
+    assert hold_delays == [1.0, 1.0, 1.0]
+
+
 # ---------------------------------------------------------------------------
 # _find_main_in_group
 # ---------------------------------------------------------------------------
@@ -341,28 +397,27 @@ def test_find_main_in_group_deterministic_regardless_of_order():
 
 
 # ---------------------------------------------------------------------------
-# _score_main_candidate
+# _score_raw_factors
 # ---------------------------------------------------------------------------
 
 
-def test_score_main_candidate_range_zero_returns_half_weights():
-    char = {
-        "name": "Solo",
-        "id": 100,
-        "total_points": 1000,
-        "total_quantity": 50,
-        "timestamps": {LEVEL_10_ACHIEVEMENT_ID: 5000},
+def test_score_raw_factors_range_zero_returns_half_weights():
+    raw_factors = {
+        "level_10_timestamp": 5000.0,
+        "character_id": 100.0,
+        "total_points": 1000.0,
+        "total_quantity": 50.0,
     }
     group_mins = dict.fromkeys(MAIN_SCORE_WEIGHTS, 0.0)
     group_ranges = dict.fromkeys(MAIN_SCORE_WEIGHTS, 0.0)
 
-    score = _score_main_candidate(char, group_mins, group_ranges)
+    score = _score_raw_factors(raw_factors, group_mins, group_ranges)
 
     expected = sum(0.5 * w for w in MAIN_SCORE_WEIGHTS.values())
     assert score == pytest.approx(expected)
 
 
-def test_score_main_candidate_inverted_factors_lower_is_better():
+def test_score_raw_factors_inverted_factors_lower_is_better():
     group_mins = {
         "level_10_timestamp": 1000.0,
         "character_id": 100.0,
@@ -375,29 +430,31 @@ def test_score_main_candidate_inverted_factors_lower_is_better():
         "total_points": 4500.0,
         "total_quantity": 90.0,
     }
-
-    low_id_char = {
-        "name": "Low",
-        "id": 100,
-        "total_points": 500,
-        "total_quantity": 10,
-        "timestamps": {LEVEL_10_ACHIEVEMENT_ID: 1000},
-    }
-    high_id_char = {
-        "name": "High",
-        "id": 500,
-        "total_points": 500,
-        "total_quantity": 10,
-        "timestamps": {LEVEL_10_ACHIEVEMENT_ID: 1000},
+    shared = {
+        "level_10_timestamp": 1000.0,
+        "total_points": 500.0,
+        "total_quantity": 10.0,
     }
 
-    low_score = _score_main_candidate(low_id_char, group_mins, group_ranges)
-    high_score = _score_main_candidate(high_id_char, group_mins, group_ranges)
+    low_score = _score_raw_factors(
+        {**shared, "character_id": 100.0}, group_mins, group_ranges
+    )
+    high_score = _score_raw_factors(
+        {**shared, "character_id": 500.0}, group_mins, group_ranges
+    )
 
     # Lower character_id should score higher (inverted factor)
     assert low_score > high_score
 
 
+def test_score_raw_factors_missing_factor_contributes_nothing():
+    group_mins = dict.fromkeys(MAIN_SCORE_WEIGHTS, 0.0)
+    group_ranges = dict.fromkeys(MAIN_SCORE_WEIGHTS, 0.0)
+    raw_factors = dict.fromkeys(MAIN_SCORE_WEIGHTS, None)
+
+    assert _score_raw_factors(raw_factors, group_mins, group_ranges) == 0.0
+
+
 # ---------------------------------------------------------------------------
 # build_profile_links
 # ---------------------------------------------------------------------------
@@ -555,6 +612,44 @@ def test_fetch_member_fingerprint_level10_excluded_from_fingerprint_tuple(mock_c
     assert result["timestamps"][LEVEL_10_ACHIEVEMENT_ID] == 500
 
 
+def test_fetch_member_fingerprint_incomplete_level10_not_recorded(mock_client):
+    member = _make_member("Darq")
+    mock_client.get_character_achievements.return_value = {
+        "achievements": [
+            {"id": LEVEL_10_ACHIEVEMENT_ID},
+            {"id": 9670, "completed_timestamp": 200},
+        ],
+        "total_quantity": 2,
+        "total_points": 20,
+    }
+
+    result = asyncio.run(fetch_member_fingerprint(mock_client, member))
+
+    assert result["timestamps"] == {9670: 200}
+    assert result["fingerprint"] == ((9670, 200),)
+
+
+def test_fetch_member_fingerprint_all_targets_found_stops_scanning(mock_client):
+    member = _make_member("Darq")
+    achievements = [{"id": LEVEL_10_ACHIEVEMENT_ID, "completed_timestamp": 50}]
+    achievements += [
+        {"id": ach_id, "completed_timestamp": 100}
+        for ach_id in FINGERPRINT_ACHIEVEMENT_IDS
+    ]
+    # Entries after the last target are never read
+    achievements.append(None)
+    mock_client.get_character_achievements.return_value = {
+        "achievements": achievements,
+        "total_quantity": len(achievements),
+        "total_points": 0,
+    }
+
+    result = asyncio.run(fetch_member_fingerprint(mock_client, member))
+
+    assert len(result["fingerprint"]) == len(FINGERPRINT_ACHIEVEMENT_IDS)
+    assert result["timestamps"][LEVEL_10_ACHIEVEMENT_ID] == 50
+
+
 def test_fetch_member_fingerprint_non_fingerprint_achievements_ignored(mock_client):
     member = _make_member("Darq")
     ach_data = {
@@ -740,6 +835,28 @@ def test_fetch_roster_details_valid_roster_returns_processed_data(mock_client):
     assert "Darq" in raw_profiles
 
 
+def test_fetch_roster_details_same_name_on_two_realms_keeps_both_profiles(
+    mock_client,
+):
+    roster = {
+        "members": [
+            _make_member("Darq", realm="terokkar", char_id=1),
+            _make_member("Darq", realm="silvermoon", char_id=2),
+        ]
+    }
+    mock_client.get_character_profile.side_effect = [
+        {"name": "Darq", "id": 1, "equipped_item_level": 480},
+        {"name": "Darq", "id": 2, "equipped_item_level": 300},
+    ]
+
+    processed, _ = asyncio.run(fetch_roster_details(mock_client, roster))
+
+    assert [(r["realm"], r["ilvl"]) for r in processed] == [
+        ("terokkar", 480),
+        ("silvermoon", 300),
+    ]
+
+
 def test_fetch_roster_details_empty_members_returns_empty(mock_client):
     processed, raw_profiles = asyncio.run(
         fetch_roster_details(mock_client, {"members": []})
@@ -809,6 +926,15 @@ def test_compute_jaccard_similarity_partial_overlap_returns_expected():
     assert result == pytest.approx(0.5)
 
 
+def test_compute_jaccard_similarity_frozensets_returns_expected():
+    fp_a = frozenset({(1, 100), (2, 200), (3, 300)})
+    fp_b = frozenset({(2, 200), (3, 300), (4, 400), (5, 500)})
+
+    result = compute_jaccard_similarity(fp_a, fp_b)
+
+    assert result == pytest.approx(2 / 5)
+
+
 def test_compute_jaccard_similarity_both_empty_returns_zero():
     result = compute_jaccard_similarity(set(), set())
 
@@ -864,6 +990,21 @@ def test_cluster_characters_small_fingerprint_isolated():
     assert len(groups) == 2
 
 
+def test_cluster_characters_interleaved_groups_keep_input_order():
+    fp_a = {(9670, 100), (10693, 200), (10691, 300)}
+    fp_b = {(10689, 400), (10687, 500), (10685, 600)}
+    chars = [
+        _make_char_data("A1", fp_a),
+        _make_char_data("B1", fp_b),
+        _make_char_data("A2", fp_a),
+        _make_char_data("B2", fp_b),
+    ]
+
+    groups = cluster_characters_by_fingerprint(chars)
+
+    assert [[c["name"] for c in g] for g in groups] == [["A1", "A2"], ["B1", "B2"]]
+
+
 def test_cluster_characters_empty_list_returns_empty():
     groups = cluster_characters_by_fingerprint([])
 
@@ -189,6 +189,16 @@ def test_data_path_multiple_components_joined_with_hyphens(mocker):
     assert result == mock_data_path / "guild-roster-export.csv"
 
 
+def test_data_path_repeated_call_returns_cached_path():
+    base_dir = Path("/mock/data")
+
+    first = data_path(base_dir, "eu", "terokkar", "guild", "ranks")
+    second = data_path(base_dir, "eu", "terokkar", "guild", "ranks")
+
+    assert first is second
+    assert data_path(Path("/other"), "eu", "terokkar", "guild", "ranks") != first
+
+
 @pytest.mark.parametrize(
     "components,expected_filename",
     [